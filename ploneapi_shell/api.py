@@ -5,79 +5,234 @@ Used by both CLI and web interface.
 
 from __future__ import annotations
 
+import atexit
 import json
 import os
 import base64
+import hashlib
 import re
+import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Coroutine, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse, urlunparse
 import time
 
 import httpx
-from thefuzz import fuzz
+
+try:
+    # orjson parses large search pages several times faster than the stdlib
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+try:
+    # With h2 installed, the async crawl and search prefetch multiplex requests over one connection
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
 
 CONFIG_ENV = os.environ.get("PLONEAPI_SHELL_CONFIG")
 CONFIG_FILE = Path(CONFIG_ENV).expanduser() if CONFIG_ENV else Path.home() / ".config" / "ploneapi_shell" / "config.json"
+CACHE_DIR = CONFIG_FILE.parent / "cache"  # ETag-validated GET responses, see fetch(cache=True)
+CACHE_MAX_ENTRIES = 500  # cached responses kept on disk; the least recently written go first
+CACHE_MAX_AGE = 7 * 24 * 3600  # seconds a cached response is kept on disk
 DEFAULT_BASE = "https://demo.plone.org/++api++/"
 TOKEN_REFRESH_LEEWAY = 120  # seconds before expiry to proactively renew
 TOKEN_REFRESH_MIN_INTERVAL = 30  # avoid hammering renew endpoint
+TOKEN_REFRESH_BLOCKING_MARGIN = 15  # below this many seconds left, renew before the request
 LOCAL_HOST_PREFIXES = ("localhost", "127.", "0.0.0.0", "::1", "[::1]")
+CRAWL_CONCURRENCY = 20  # max concurrent folder fetches when browsing for tags
+SEARCH_PREFETCH = 4  # @search batches requested concurrently when collecting tags
+FETCH_MANY_CONCURRENCY = 8  # default cap on concurrent GETs in fetch_many
+UPDATE_CONCURRENCY = 8  # default cap on concurrent subject updates in bulk tag edits
+TAG_CACHE_TTL = 60  # seconds a get_all_tags result is reused
+TAG_INTERN_LIMIT = 50000  # stop interning tags past this many unique ones (interned strings are never freed)
+SIMILAR_TAGS_BLOCK = 256  # rows of the tag-similarity matrix scored at once
+# Where Plone REST API responses may carry an item's subjects, in lookup order
+_SUBJECT_PRIMARY_KEYS = ("Subject", "subject")
+_SUBJECT_NESTED_KEYS = ("@components", "metadata")
+_SUBJECT_FALLBACK_KEYS = ("subjects", "keywords", "Keywords", "tags", "Tags")
+# Catalog metadata the tag search and crawl need; @id and @type are always in summaries.
+# fullobjects is never sent: plone.restapi treats any value, even "0", as true.
+_TAG_METADATA_FIELDS = ("Subject", "is_folderish")
+_CONTAINER_TYPES = frozenset({"Folder", "Collection"})  # crawled even without is_folderish
 IP_PATTERN = re.compile(r"^\d{1,3}(?:\.\d{1,3}){3}$")
 
+# Single worker so at most one @login-renew call runs in the background at a time
+_REFRESH_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ploneapi-token-refresh")
+_REFRESH_LOCK = threading.Lock()
+_refresh_in_flight = False
+
+# Shared client so repeated requests to the same site reuse pooled keep-alive connections
+_CLIENT: Optional[httpx.Client] = None
+_CLIENT_LOCK = threading.Lock()
+
+# Parsed config file: ((st_mtime_ns, st_size), data), see load_config
+_config_cache: Optional[Tuple[Tuple[int, int], Optional[Dict[str, Any]]]] = None
+
+# get_all_tags results: (base, path, no_auth) -> (monotonic timestamp, tag counts)
+_TAG_CACHE: Dict[Tuple[str, str, bool], Tuple[float, Counter[str]]] = {}
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Parse a JSON document, using orjson when it is installed."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data: Any, indent: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON bytes (two-space indented if requested), using orjson when installed."""
+    if _orjson is not None:
+        return _orjson.dumps(data, option=_orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
 
 class APIError(Exception):
     """Base exception for API operations."""
     pass
 
 
+def _get_client() -> httpx.Client:
+    """Return the shared HTTP client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = httpx.Client(
+                    http2=_HTTP2,
+                    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                    timeout=15,
+                )
+    return _CLIENT
+
+
+def close_client() -> None:
+    """Close the shared HTTP client and release its pooled connections."""
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is not None:
+            _CLIENT.close()
+            _CLIENT = None
+
+
+atexit.register(close_client)
+
+
+@lru_cache(maxsize=32)
+def _strip_base(base: str) -> str:
+    """Return base without trailing slashes (memoized; the same few bases are compared per request)."""
+    return base.rstrip("/")
+
+
+@lru_cache(maxsize=32)
+def _base_with_slash(base: str) -> Tuple[str, bool]:
+    """Return base with exactly one trailing slash, and whether plain concatenation is safe for it."""
+    return base.rstrip("/") + "/", not (base.endswith("//") or any(char in base for char in "?#"))
+
+
+def _needs_urljoin(path: str) -> bool:
+    """True if path has dot segments, empty segments, a query/fragment, or a colon that urljoin must interpret."""
+    if ":" in path or "?" in path or "#" in path or "//" in path:
+        return True
+    return "./" in path or path in (".", "..") or path.endswith(("/.", "/.."))
+
+
 def resolve_url(path_or_url: str | None, base: str) -> str:
     """Resolve a path or URL relative to base URL."""
     # Ensure base is a string (handle Typer Option objects)
     if not isinstance(base, str):
         base = get_base_url(None)
+    base_slash, simple_base = _base_with_slash(base)
     if not path_or_url:
-        return base.rstrip("/") + "/"
-    if path_or_url.startswith(("http://", "https://")):
+        return base_slash
+    if path_or_url[0] == "h" and path_or_url.startswith(("http://", "https://")):
         return path_or_url
+    path = path_or_url.lstrip("/")
+    # Plain relative paths under the ++api++ base are the common case; they join by concatenation
+    if simple_base and not _needs_urljoin(path):
+        return base_slash + path
     # Ensure base ends with / for proper urljoin behavior
     if not base.endswith("/"):
         base = base + "/"
-    path = path_or_url.lstrip("/")
     return urljoin(base, path)
 
 
 def load_config() -> Optional[Dict[str, Any]]:
-    """Load configuration from file."""
+    """Load configuration from file.
+    
+    The parsed file is cached and only re-read when its mtime or size changes, so
+    repeated lookups (base URL, auth headers, REPL completions) cost a stat() call.
+    Callers get a shallow copy they are free to modify.
+    """
+    config = _read_config()
+    return dict(config) if config is not None else None
+
+
+def _read_config() -> Optional[Dict[str, Any]]:
+    """Return the cached config dict itself; callers must treat it as read-only."""
+    global _config_cache
     try:
-        with CONFIG_FILE.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        stat = CONFIG_FILE.stat()
     except FileNotFoundError:
+        _config_cache = None
         return None
-    except json.JSONDecodeError:
-        return None
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _config_cache
+    if cached is None or cached[0] != signature:
+        try:
+            data = json_loads(CONFIG_FILE.read_bytes())
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            data = None
+        cached = _config_cache = (signature, data if isinstance(data, dict) else None)
+    return cached[1]
 
 
 def save_config(data: Dict[str, Any]) -> None:
     """Save configuration to file."""
-    CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with CONFIG_FILE.open("w", encoding="utf-8") as handle:
-        json.dump(data, handle, indent=2)
-    if os.name == "posix":
-        os.chmod(CONFIG_FILE, 0o600)
-
-
-def delete_config() -> None:
-    """Delete configuration file."""
+    global _config_cache
+    _config_cache = None
+    payload = json_dumps(data, indent=True)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    try:
+        # Create the file owner-only from the start so a saved token is never world-readable
+        fd = os.open(CONFIG_FILE, flags, 0o600)
+    except FileNotFoundError:
+        # Only the very first save needs to create the config directory
+        CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(CONFIG_FILE, flags, 0o600)
+    with os.fdopen(fd, "wb") as handle:
+        if os.name == "posix":
+            # The mode above only applies to new files; tighten an existing one before writing
+            os.fchmod(fd, 0o600)
+        handle.write(payload)
+
+
+def delete_config() -> bool:
+    """Delete configuration file. Returns False if there was none."""
+    global _config_cache
+    _config_cache = None
+    # Cached responses may have been fetched with the credentials being removed
+    clear_response_cache()
     try:
         CONFIG_FILE.unlink()
     except FileNotFoundError:
-        pass
+        return False
+    return True
 
 
 def get_saved_base() -> Optional[str]:
     """Get saved base URL from config."""
-    config = load_config()
+    config = _read_config()
     if not config:
         return None
     saved_base = config.get("base")
@@ -158,7 +313,7 @@ def verify_base_url(base: str) -> None:
     """Attempt to fetch base URL to confirm it's reachable."""
     url = resolve_url(None, base)
     try:
-        response = httpx.get(url, timeout=10)
+        response = _get_client().get(url, timeout=10)
     except httpx.RequestError as exc:
         raise APIError(f"Unable to reach {url}: {exc}") from exc
 
@@ -169,19 +324,30 @@ def verify_base_url(base: str) -> None:
     raise APIError(f"Base URL responded with status {response.status_code} for {url}")
 
 
+def _decode_jwt_payload(token: str) -> Optional[Dict[str, Any]]:
+    """Return the claims of a JWT token without verifying its signature."""
+    _, sep, rest = token.partition(".")
+    if not sep:
+        return None
+    payload_segment = rest.partition(".")[0]
+    if not payload_segment:
+        return None
+    try:
+        padding = b"=" * (-len(payload_segment) & 3)
+        payload_bytes = base64.urlsafe_b64decode(payload_segment.encode("ascii") + padding)
+        payload = json.loads(payload_bytes)
+    except Exception:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
 def _decode_jwt_exp(token: str) -> Optional[int]:
     """Return exp timestamp from JWT token without verifying signature."""
+    payload = _decode_jwt_payload(token) or {}
     try:
-        parts = token.split(".")
-        if len(parts) < 2:
-            return None
-        payload_segment = parts[1]
-        padding = "=" * (-len(payload_segment) % 4)
-        payload_bytes = base64.urlsafe_b64decode(payload_segment + padding)
-        payload = json.loads(payload_bytes.decode("utf-8"))
         exp = payload.get("exp")
         return int(exp) if exp is not None else None
-    except Exception:
+    except (TypeError, ValueError):
         return None
 
 
@@ -226,9 +392,9 @@ def _renew_token(base: str, current_token: str, username: Optional[str]) -> Opti
     renew_url = resolve_url("@login-renew", base)
     headers = {"Authorization": f"Bearer {current_token}"}
     try:
-        response = httpx.post(renew_url, headers=headers, timeout=15)
+        response = _get_client().post(renew_url, headers=headers, timeout=15)
         response.raise_for_status()
-        payload = response.json()
+        payload = json_loads(response.content)
         new_token = payload.get("token")
         if new_token:
             _save_token(base, new_token, username)
@@ -239,13 +405,43 @@ def _renew_token(base: str, current_token: str, username: Optional[str]) -> Opti
     return None
 
 
+def _refresh_token(base: str, token: str, auth: Dict[str, Any]) -> Optional[str]:
+    """Renew token, recording the attempt time on failure to respect the min interval."""
+    refreshed = _renew_token(base, token, auth.get("username"))
+    if not refreshed:
+        auth_copy = dict(auth)
+        auth_copy["updated_at"] = int(time.time())
+        _write_auth_config(base, auth_copy)
+    return refreshed
+
+
+def _background_refresh(base: str, token: str, auth: Dict[str, Any]) -> None:
+    """Run a token refresh on the executor and clear the in-flight flag afterwards."""
+    global _refresh_in_flight
+    try:
+        _refresh_token(base, token, auth)
+    finally:
+        with _REFRESH_LOCK:
+            _refresh_in_flight = False
+
+
+def _schedule_token_refresh(base: str, token: str, auth: Dict[str, Any]) -> None:
+    """Submit a background token refresh unless one is already running."""
+    global _refresh_in_flight
+    with _REFRESH_LOCK:
+        if _refresh_in_flight:
+            return
+        _refresh_in_flight = True
+    _REFRESH_EXECUTOR.submit(_background_refresh, base, token, auth)
+
+
 def get_saved_auth_headers(base: str) -> Dict[str, str]:
     """Get saved authentication headers for a base URL."""
-    config = load_config()
+    config = _read_config()
     if not config:
         return {}
     saved_base = config.get("base")
-    if not saved_base or saved_base.rstrip("/") != base.rstrip("/"):
+    if not saved_base or _strip_base(saved_base) != _strip_base(base):
         return {}
     auth = config.get("auth") or {}
     mode = auth.get("mode")
@@ -253,55 +449,173 @@ def get_saved_auth_headers(base: str) -> Dict[str, str]:
     if mode != "token" or not token:
         return {}
     if _should_refresh_token(auth):
-        refreshed = _renew_token(base, token, auth.get("username"))
-        if refreshed:
-            token = refreshed
+        if auth["token_exp"] - int(time.time()) > TOKEN_REFRESH_BLOCKING_MARGIN:
+            # Token is still valid, so renew in the background and use it for this request
+            _schedule_token_refresh(base, token, auth)
         else:
-            auth_copy = dict(auth)
-            auth_copy["updated_at"] = int(time.time())
-            _write_auth_config(base, auth_copy)
+            refreshed = _refresh_token(base, token, auth)
+            if refreshed:
+                token = refreshed
     return {"Authorization": f"Bearer {token}"} if token else {}
 
 
+def has_authorization_header(headers: Dict[str, str]) -> bool:
+    """Return True if headers already carry an Authorization header (any case)."""
+    # Only lower-case keys that could possibly match
+    return any(key[:1] in "Aa" and key.lower() == "authorization" for key in headers)
+
+
 def apply_auth(headers: Dict[str, str], base: str, no_auth: bool = False) -> Dict[str, str]:
-    """Apply authentication headers if not already present."""
-    merged = dict(headers)
-    if no_auth or any(key.lower() == "authorization" for key in merged):
-        return merged
-    merged.update(get_saved_auth_headers(base))
-    return merged
+    """Apply authentication headers if not already present.
+    
+    The given dict is returned as-is when there is nothing to add, so callers must
+    not modify the result in place.
+    """
+    if no_auth or has_authorization_header(headers):
+        return headers
+    saved = get_saved_auth_headers(base)
+    if not saved:
+        return headers
+    return {**headers, **saved}
+
+
+def _cache_identity(name: str, value: str) -> str:
+    """The part of a request header that goes into the cache key.
+    
+    A bearer JWT stands for its user (the "sub" claim), so renewing the token keeps
+    hitting the same entries; any other header counts with its full value.
+    """
+    if name.lower() == "authorization":
+        scheme, _, token = value.partition(" ")
+        if scheme.lower() == "bearer":
+            subject = (_decode_jwt_payload(token) or {}).get("sub")
+            if subject:
+                return f"user:{subject}"
+    return value
+
+
+def _cache_path(url: str, headers: Dict[str, str], params: Dict[str, Any]) -> Path:
+    """Cache file for a GET; the user is part of the key so users never share entries."""
+    identity = sorted((name, _cache_identity(name, value)) for name, value in headers.items())
+    key = json_dumps([url, identity, sorted(params.items())])
+    return CACHE_DIR / f"{hashlib.blake2b(key, digest_size=16).hexdigest()}.json"
+
+
+def _prune_response_cache() -> None:
+    """Drop cached responses older than CACHE_MAX_AGE, then the oldest past CACHE_MAX_ENTRIES."""
+    try:
+        with os.scandir(CACHE_DIR) as entries:
+            files = [(entry.stat().st_mtime, entry.path) for entry in entries if entry.name.endswith(".json")]
+    except OSError:
+        return
+    cutoff = time.time() - CACHE_MAX_AGE
+    files.sort(reverse=True)
+    for index, (mtime, path) in enumerate(files):
+        if index >= CACHE_MAX_ENTRIES or mtime < cutoff:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+def _read_cached_response(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "rb") as handle:
+            entry = json_loads(handle.read())
+    except (OSError, ValueError):
+        return None
+    return entry if isinstance(entry, dict) and "body" in entry else None
+
+
+def _write_cached_response(path: Path, response: httpx.Response, data: Any) -> None:
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not (etag or last_modified) or "no-store" in response.headers.get("Cache-Control", "").lower():
+        # Nothing to revalidate against, or the server asked us not to keep it
+        try:
+            path.unlink()
+        except OSError:
+            pass
+        return
+    payload = json_dumps({"etag": etag, "last_modified": last_modified, "body": data})
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    try:
+        try:
+            # Responses may contain private content, so keep them owner-only like the config file
+            fd = os.open(path, flags, 0o600)
+        except FileNotFoundError:
+            CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd = os.open(path, flags, 0o600)
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+    except OSError:
+        return  # The cache is best effort; the response itself is still good
+    _prune_response_cache()
+
+
+def clear_response_cache() -> None:
+    """Delete all cached GET responses."""
+    try:
+        entries = list(CACHE_DIR.glob("*.json"))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            entry.unlink()
+        except OSError:
+            pass
 
 
 def fetch(
     path_or_url: str | None,
     base: str,
     headers: Dict[str, str],
-    params: Dict[str, str],
+    params: Dict[str, Any],
     no_auth: bool = False,
+    cache: bool = False,
 ) -> Tuple[str, Dict]:
-    """Fetch data from API endpoint."""
+    """Fetch data from API endpoint.
+
+    With ``cache=True`` the response is stored on disk when the server sends an
+    ETag or Last-Modified header, and later calls revalidate it with a
+    conditional GET so an unchanged resource comes back as a bodiless 304.
+    """
     # Ensure base is a string (handle Typer Option objects)
     if not isinstance(base, str):
         base = get_base_url(None)
     url = resolve_url(path_or_url, base)
     prepared_headers = apply_auth(headers, base, no_auth)
+    cache_path = cached = None
+    request_headers = prepared_headers
+    if cache:
+        cache_path = _cache_path(url, prepared_headers, params)
+        cached = _read_cached_response(cache_path)
+        if cached is not None:
+            request_headers = dict(prepared_headers)
+            if cached.get("etag"):
+                request_headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                request_headers["If-Modified-Since"] = cached["last_modified"]
     try:
-        response = httpx.get(
+        response = _get_client().get(
             url,
-            headers=prepared_headers or None,
+            headers=request_headers or None,
             params=params or None,
             timeout=15,
         )
+        if cached is not None and response.status_code == 304:
+            return url, cached["body"]
         response.raise_for_status()
+        data = json_loads(response.content)
+        if cache_path is not None:
+            _write_cached_response(cache_path, response, data)
+        return url, data
     except httpx.HTTPStatusError as exc:
         raise APIError(f"Request failed with status {exc.response.status_code} for {url}") from exc
     except httpx.RequestError as exc:
         raise APIError(f"Unable to reach {url}: {exc}") from exc
-    try:
-        data = response.json()
     except ValueError as exc:
         raise APIError("Response is not JSON.") from exc
-    return url, data
 
 
 def post(
@@ -316,11 +630,9 @@ def post(
     if not isinstance(base, str):
         base = get_base_url(None)
     url = resolve_url(path_or_url, base)
-    prepared_headers = apply_auth(headers, base, no_auth)
-    if "Content-Type" not in prepared_headers:
-        prepared_headers["Content-Type"] = "application/json"
+    prepared_headers = {"Content-Type": "application/json", **apply_auth(headers, base, no_auth)}
     try:
-        response = httpx.post(
+        response = _get_client().post(
             url,
             json=json_data,
             headers=prepared_headers or None,
@@ -330,7 +642,7 @@ def post(
     except httpx.HTTPStatusError as exc:
         error_msg = f"Request failed with status {exc.response.status_code} for {url}"
         try:
-            error_data = exc.response.json()
+            error_data = json_loads(exc.response.content)
             if "message" in error_data:
                 error_msg += f": {error_data['message']}"
         except ValueError:
@@ -339,7 +651,7 @@ def post(
     except httpx.RequestError as exc:
         raise APIError(f"Unable to reach {url}: {exc}") from exc
     try:
-        data = response.json() if response.content else {}
+        data = json_loads(response.content) if response.content else {}
     except ValueError:
         data = {}
     return url, data
@@ -357,14 +669,14 @@ def patch(
     if not isinstance(base, str):
         base = get_base_url(None)
     url = resolve_url(path_or_url, base)
-    prepared_headers = apply_auth(headers, base, no_auth)
-    if "Content-Type" not in prepared_headers:
-        prepared_headers["Content-Type"] = "application/json"
     # Ensure Accept header is set for JSON response (required by Plone REST API)
-    if "Accept" not in prepared_headers:
-        prepared_headers["Accept"] = "application/json"
+    prepared_headers = {
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+        **apply_auth(headers, base, no_auth),
+    }
     try:
-        response = httpx.patch(
+        response = _get_client().patch(
             url,
             json=json_data,
             headers=prepared_headers or None,
@@ -374,7 +686,7 @@ def patch(
     except httpx.HTTPStatusError as exc:
         error_msg = f"Request failed with status {exc.response.status_code} for {url}"
         try:
-            error_data = exc.response.json()
+            error_data = json_loads(exc.response.content)
             if "message" in error_data:
                 error_msg += f": {error_data['message']}"
             elif "error" in error_data:
@@ -396,7 +708,7 @@ def patch(
     except httpx.RequestError as exc:
         raise APIError(f"Unable to reach {url}: {exc}") from exc
     try:
-        data = response.json() if response.content else {}
+        data = json_loads(response.content) if response.content else {}
     except ValueError:
         data = {}
     return url, data
@@ -411,7 +723,7 @@ def login(base: str, username: str, password: str) -> Dict[str, Any]:
     base = normalize_base_input(base)
     login_url = resolve_url("@login", base)
     try:
-        response = httpx.post(
+        response = _get_client().post(
             login_url,
             json={"login": username, "password": password},
             timeout=15,
@@ -421,7 +733,7 @@ def login(base: str, username: str, password: str) -> Dict[str, Any]:
         raise APIError(f"Login failed with status {exc.response.status_code}.") from exc
     except httpx.RequestError as exc:
         raise APIError(f"Unable to reach {login_url}: {exc}") from exc
-    payload = response.json()
+    payload = json_loads(response.content)
     token = payload.get("token")
     if not token:
         raise APIError("Login response did not include a token.")
@@ -457,14 +769,14 @@ def search_by_type(base: str, portal_type: str, path: str = "", no_auth: bool =
     
     try:
         # First page
-        response = httpx.get(
+        response = _get_client().get(
             search_url,
             params=params,
             headers=headers or None,
             timeout=15,
         )
         response.raise_for_status()
-        data = response.json()
+        data = json_loads(response.content)
         items = data.get("items", [])
         all_items.extend(items)
         
@@ -474,14 +786,14 @@ def search_by_type(base: str, portal_type: str, path: str = "", no_auth: bool =
         
         while items_total > len(all_items) and len(all_items) < max_items:
             params["b_start"] = len(all_items)
-            response = httpx.get(
+            response = _get_client().get(
                 search_url,
                 params=params,
                 headers=headers or None,
                 timeout=15,
             )
             response.raise_for_status()
-            page_data = response.json()
+            page_data = json_loads(response.content)
             page_items = page_data.get("items", [])
             if not page_items:
                 break
@@ -522,14 +834,14 @@ def search_by_subject(base: str, subject: str, path: str = "", no_auth: bool = F
     
     try:
         # First page
-        response = httpx.get(
+        response = _get_client().get(
             search_url,
             params=params,
             headers=headers or None,
             timeout=15,
         )
         response.raise_for_status()
-        data = response.json()
+        data = json_loads(response.content)
         items = data.get("items", [])
         all_items.extend(items)
         
@@ -539,14 +851,14 @@ def search_by_subject(base: str, subject: str, path: str = "", no_auth: bool = F
         
         while items_total > len(all_items) and len(all_items) < max_items:
             params["b_start"] = len(all_items)
-            response = httpx.get(
+            response = _get_client().get(
                 search_url,
                 params=params,
                 headers=headers or None,
                 timeout=15,
             )
             response.raise_for_status()
-            page_data = response.json()
+            page_data = json_loads(response.content)
             page_items = page_data.get("items", [])
             if not page_items:
                 break
@@ -563,10 +875,293 @@ def search_by_subject(base: str, subject: str, path: str = "", no_auth: bool = F
         return []
 
 
+def _coerce_subjects(value: Any) -> List[Any]:
+    """Turn any other subject value (tuple, set, ...) into a list."""
+    try:
+        return list(value) if value else []
+    except (TypeError, ValueError):
+        return []
+
+
+_SUBJECT_COERCERS: Dict[type, Callable[[Any], List[Any]]] = {
+    list: lambda value: value,
+    str: lambda value: [value] if value else [],
+    type(None): lambda value: [],
+}
+
+
+def is_container(item: Dict[str, Any]) -> bool:
+    """Whether a listed item can hold other items (folderish, or a known container type)."""
+    return bool(item.get("is_folderish")) or item.get("@type") in _CONTAINER_TYPES
+
+
+def extract_subjects(item: Dict[str, Any], intern: bool = False) -> List[str]:
+    """Return the stripped, non-empty subjects of a search result or content item.
+    
+    With intern=True the tags are interned, so repeated tags across a large crawl share
+    one string object and counter lookups hit on identity.
+    """
+    # Same priority as before: Subject/subject, then the nested forms, then the
+    # less common field names
+    subjects = None
+    for key in _SUBJECT_PRIMARY_KEYS:
+        subjects = item.get(key)
+        if subjects is not None:
+            break
+    else:
+        for container in _SUBJECT_NESTED_KEYS:
+            nested = item.get(container)
+            if isinstance(nested, dict) and "Subject" in nested:
+                subjects = nested["Subject"]
+                break
+        else:
+            for key in _SUBJECT_FALLBACK_KEYS:
+                subjects = item.get(key)
+                if subjects is not None:
+                    break
+    
+    # Normalize to a list; a single string becomes a one-element list
+    subjects = _SUBJECT_COERCERS.get(type(subjects), _coerce_subjects)(subjects)
+    
+    # Strip each string once, then drop the ones left empty (and non-strings such as None)
+    cleaned = [t for t in (s.strip() for s in subjects if isinstance(s, str)) if t]
+    if intern:
+        return [sys.intern(t) for t in cleaned]
+    return cleaned
+
+
+def _run_sync(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine from synchronous code, even when called inside a running event loop."""
+    # asyncio (like rapidfuzz in find_similar_tags) is imported on first use:
+    # it is a sizeable share of startup time and one-shot commands rarely need it
+    import asyncio
+    
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    # Already inside an event loop (e.g. a prompt_toolkit completer), so use a helper thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+async def _collect_tags_async(
+    base: str,
+    root: str,
+    no_auth: bool,
+    tag_counts: Counter[str],
+    max_depth: int = 20,
+    debug_callback: Optional[Callable[[str], None]] = None,
+) -> None:
+    """Breadth-first crawl from root, counting subjects into tag_counts.
+    
+    Each level's folders are fetched concurrently over one pooled AsyncClient,
+    bounded by CRAWL_CONCURRENCY. Paths that can't be fetched are skipped.
+    If debug_callback is given, it receives a line per level with the work done.
+    """
+    import asyncio
+    
+    headers = apply_auth({}, base, no_auth)
+    semaphore = asyncio.Semaphore(CRAWL_CONCURRENCY)
+    base_stripped = base.rstrip("/")
+    visited_paths = {root}
+    level = [root]
+    depth = 0
+    
+    async with httpx.AsyncClient(
+        http2=_HTTP2,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        timeout=15,
+    ) as client:
+        
+        async def fetch_folder(folder_path: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    response = await client.get(
+                        resolve_url(folder_path, base),
+                        params={"metadata_fields": list(_TAG_METADATA_FIELDS)},
+                        headers=headers or None,
+                    )
+                    response.raise_for_status()
+                    data = json_loads(response.content)
+                except (httpx.HTTPError, ValueError):
+                    return None  # Skip if we can't access this path
+            return data if isinstance(data, dict) else None
+        
+        while level and depth <= max_depth:
+            next_level: List[str] = []
+            failed = 0
+            items_seen = 0
+            for data in await asyncio.gather(*(fetch_folder(p) for p in level)):
+                if not data:
+                    failed += 1
+                    continue
+                items = data.get("items", [])
+                items_seen += len(items)
+                for item in items:
+                    tag_counts.update(extract_subjects(item, len(tag_counts) < TAG_INTERN_LIMIT))
+                    
+                    # If it's a container, queue it for the next level
+                    if is_container(item):
+                        item_path = item.get("@id", "").replace(base_stripped, "").lstrip("/")
+                        if item_path and item_path not in visited_paths:
+                            visited_paths.add(item_path)
+                            next_level.append(item_path)
+            if debug_callback:
+                debug_callback(
+                    f"DEBUG: Crawl depth {depth}: fetched {len(level) - failed}/{len(level)} folders, "
+                    f"{items_seen} items, {len(tag_counts)} unique tags so far"
+                )
+            level = next_level
+            depth += 1
+
+
+async def _fetch_search_pages_async(
+    search_url: str,
+    params: Dict[str, Any],
+    headers: Dict[str, str],
+    starts: Iterable[int],
+    on_items: Callable[[List[Dict[str, Any]]], None],
+) -> int:
+    """Fetch the @search batches at the given b_start offsets, SEARCH_PREFETCH at a time.
+    
+    Each page's items are passed to on_items as soon as that page arrives (so not
+    necessarily in order). Returns the number of items seen; HTTP errors propagate.
+    """
+    import asyncio
+    
+    semaphore = asyncio.Semaphore(SEARCH_PREFETCH)
+    items_seen = 0
+    
+    async with httpx.AsyncClient(
+        http2=_HTTP2,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        timeout=15,
+    ) as client:
+        
+        async def fetch_page(start: int) -> List[Dict[str, Any]]:
+            async with semaphore:
+                response = await client.get(search_url, params={**params, "b_start": start}, headers=headers or None)
+                response.raise_for_status()
+                return json_loads(response.content).get("items", [])
+        
+        tasks = [asyncio.ensure_future(fetch_page(start)) for start in starts]
+        try:
+            for next_page in asyncio.as_completed(tasks):
+                page_items = await next_page
+                on_items(page_items)
+                items_seen += len(page_items)
+        finally:
+            # On error, don't leave the remaining requests running against a closed client
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    return items_seen
+
+
+async def _fetch_many_async(
+    urls: Dict[str, str],
+    headers: Dict[str, str],
+    concurrency: int,
+    results: Dict[str, Dict[str, Any]],
+    errors: Dict[str, APIError],
+) -> None:
+    """GET every url concurrently (at most concurrency at a time), filling results/errors by path."""
+    import asyncio
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async with httpx.AsyncClient(
+        http2=_HTTP2,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        timeout=15,
+    ) as client:
+        
+        async def fetch_one(path: str, url: str) -> None:
+            async with semaphore:
+                try:
+                    response = await client.get(url, headers=headers or None)
+                    response.raise_for_status()
+                    results[path] = json_loads(response.content)
+                except httpx.HTTPStatusError as exc:
+                    errors[path] = APIError(f"Request failed with status {exc.response.status_code} for {url}")
+                except httpx.RequestError as exc:
+                    errors[path] = APIError(f"Unable to reach {url}: {exc}")
+                except ValueError:
+                    errors[path] = APIError("Response is not JSON.")
+        
+        await asyncio.gather(*(fetch_one(path, url) for path, url in urls.items()))
+
+
+def fetch_many(
+    base: str,
+    paths: Iterable[Optional[str]],
+    concurrency: int = FETCH_MANY_CONCURRENCY,
+    no_auth: bool = False,
+) -> Tuple[Dict[Optional[str], Dict[str, Any]], Dict[Optional[str], APIError]]:
+    """Fetch several paths or URLs concurrently over one async client.
+    
+    Args:
+        base: Base API URL
+        paths: Paths (relative to base) or absolute URLs; None means the API root
+        concurrency: Maximum number of requests in flight at once
+        no_auth: Whether to skip authentication
+        
+    Returns:
+        (results, errors): response data per fetched path, and the APIError per
+        path that could not be fetched
+    """
+    # Ensure base is a string
+    if not isinstance(base, str):
+        base = get_base_url(None)
+    
+    urls = {path: resolve_url(path, base) for path in paths}
+    results: Dict[Optional[str], Dict[str, Any]] = {}
+    errors: Dict[Optional[str], APIError] = {}
+    if urls:
+        headers = apply_auth({}, base, no_auth)
+        _run_sync(_fetch_many_async(urls, headers, max(1, concurrency), results, errors))
+    return results, errors
+
+
+def fill_subjects(
+    base: str,
+    items: List[Dict[str, Any]],
+    concurrency: int = FETCH_MANY_CONCURRENCY,
+    no_auth: bool = False,
+) -> Dict[str, APIError]:
+    """Set "subjects" on search results that lack it, fetching those items concurrently.
+    
+    Catalog results only carry subjects when the server adds them to the summary, so
+    tag rewrites fetch the rest to start from each item's current subjects. Items that
+    cannot be fetched are left without "subjects".
+    
+    Returns:
+        The APIError per "@id" that could not be fetched
+    """
+    missing = [item["@id"] for item in items if "subjects" not in item and item.get("@id")]
+    if not missing:
+        return {}
+    results, errors = fetch_many(base, missing, concurrency, no_auth)
+    for item in items:
+        data = results.get(item.get("@id"))
+        if data is not None and "subjects" not in item:
+            item["subjects"] = extract_subjects(data)
+    return errors
+
+
+def invalidate_tag_cache() -> None:
+    """Forget memoized get_all_tags results (call after changing tags or moving items)."""
+    _TAG_CACHE.clear()
+
+
 def get_all_tags(base: str, path: str = "", no_auth: bool = False, debug: bool = False, warn_callback: Optional[Callable[[str], None]] = None, debug_callback: Optional[Callable[[str], None]] = None) -> Dict[str, int]:
     """
     Get all tags/subjects with their frequency from items in a path.
     
+    Non-empty results are memoized per (base, path, no_auth) for TAG_CACHE_TTL
+    seconds; debug runs always go to the server.
+    
     Args:
         base: Base API URL
         path: Path to search (empty for root)
@@ -579,7 +1174,23 @@ def get_all_tags(base: str, path: str = "", no_auth: bool = False, debug: bool =
     if not isinstance(base, str):
         base = get_base_url(None)
     
-    tag_counts: Dict[str, int] = {}
+    cache_key = (base.rstrip("/"), path or "", no_auth)
+    if not debug:
+        entry = _TAG_CACHE.get(cache_key)
+        if entry and time.monotonic() - entry[0] < TAG_CACHE_TTL:
+            return Counter(entry[1])
+    
+    tag_counts = _get_all_tags_uncached(base, path, no_auth, debug, warn_callback, debug_callback)
+    # An empty result is what a failed or unauthorized crawl returns too, so it is never
+    # reused; the next call (e.g. right after login) asks the server again
+    if tag_counts:
+        _TAG_CACHE[cache_key] = (time.monotonic(), Counter(tag_counts))
+    return tag_counts
+
+
+def _get_all_tags_uncached(base: str, path: str, no_auth: bool, debug: bool, warn_callback: Optional[Callable[[str], None]], debug_callback: Optional[Callable[[str], None]]) -> Dict[str, int]:
+    debug_msg = debug_callback or print
+    tag_counts: Counter[str] = Counter()
     used_search = False
     
     # Try search endpoint first - query the catalog for items with subjects
@@ -589,7 +1200,8 @@ def get_all_tags(base: str, path: str = "", no_auth: bool = False, debug: bool =
         # We'll get all items and extract their subjects
         params = {
             "b_size": 1000,  # Get up to 1000 items per page
-            "metadata_fields": "_all",  # Request all metadata including Subject field
+            # Only the metadata columns we read; "_all" made the server serialize every column
+            "metadata_fields": list(_TAG_METADATA_FIELDS),
         }
         # Explicitly request Subject field if the API supports it
         # Some Plone REST API versions need explicit field requests
@@ -597,19 +1209,18 @@ def get_all_tags(base: str, path: str = "", no_auth: bool = False, debug: bool =
             params["path"] = path
         
         headers = apply_auth({}, base, no_auth)
-        response = httpx.get(
+        response = _get_client().get(
             search_url,
             params=params,
             headers=headers or None,
             timeout=15,
         )
         response.raise_for_status()
-        data = response.json()
+        data = json_loads(response.content)
         items = data.get("items", [])
         used_search = True
         
         if debug:
-            debug_msg = debug_callback or print
             debug_msg(f"DEBUG: Search returned {len(items)} items")
             if items:
                 debug_msg(f"DEBUG: First item keys: {list(items[0].keys())}")
@@ -630,7 +1241,7 @@ def get_all_tags(base: str, path: str = "", no_auth: bool = False, debug: bool =
                         debug_msg(f"DEBUG: No subject-related keys found. All keys: {list(items[0].keys())}")
                 # Show full first item structure for debugging
                 debug_msg(f"DEBUG: First item full structure (first 30 keys):")
-                for i, (k, v) in enumerate(list(items[0].items())[:30]):
+                for k, v in islice(items[0].items(), 30):
                     if isinstance(v, (list, dict)) and len(str(v)) > 100:
                         debug_msg(f"  {k}: {type(v).__name__} (length: {len(v) if hasattr(v, '__len__') else 'N/A'})")
                     else:
@@ -643,58 +1254,10 @@ def get_all_tags(base: str, path: str = "", no_auth: bool = False, debug: bool =
         items_checked = 0
         for item in items:
             items_checked += 1
-            # In Plone, the Subject field is the primary field for tags/keywords
-            # It's indexed in portal_catalog as a KeywordIndex
-            # Check for Subject field first (capital S is the standard)
-            subjects = None
-            
-            # Priority 1: Direct Subject field (most common in Plone REST API)
-            if "Subject" in item:
-                subjects = item["Subject"]
-            # Priority 2: Lowercase subject (some REST API implementations)
-            elif "subject" in item:
-                subjects = item["subject"]
-            # Priority 3: Check in @components (some REST API versions nest it)
-            elif "@components" in item and "Subject" in item["@components"]:
-                subjects = item["@components"]["Subject"]
-            # Priority 4: Check in metadata if present
-            elif "metadata" in item and "Subject" in item["metadata"]:
-                subjects = item["metadata"]["Subject"]
-            # Priority 5: Other possible field names
-            elif "subjects" in item:
-                subjects = item["subjects"]
-            elif "keywords" in item:
-                subjects = item["keywords"]
-            elif "Keywords" in item:
-                subjects = item["Keywords"]
-            elif "tags" in item:
-                subjects = item["tags"]
-            elif "Tags" in item:
-                subjects = item["Tags"]
-            
-            # Handle different data types
-            if subjects is None:
-                subjects = []
-            elif isinstance(subjects, str):
-                # Single string value - convert to list
-                subjects = [subjects] if subjects else []
-            elif not isinstance(subjects, list):
-                # Try to convert other types
-                try:
-                    subjects = list(subjects) if subjects else []
-                except (TypeError, ValueError):
-                    subjects = []
-            
-            # Filter out empty strings and None values
-            subjects = [s for s in subjects if s and isinstance(s, str) and s.strip()]
-            
+            subjects = extract_subjects(item, len(tag_counts) < TAG_INTERN_LIMIT)
             if subjects:
-                for subject in subjects:
-                    subject = subject.strip()
-                    if subject:
-                        tag_counts[subject] = tag_counts.get(subject, 0) + 1
+                tag_counts.update(subjects)
                 if debug and items_checked <= 5:
-                    debug_msg = debug_callback or print
                     debug_msg(f"DEBUG: Item {items_checked} has subjects: {subjects}")
             else:
                 # Store item URL to fetch full details later
@@ -702,290 +1265,145 @@ def get_all_tags(base: str, path: str = "", no_auth: bool = False, debug: bool =
                 if item_url:
                     items_without_subjects.append(item_url)
                 if debug and items_checked <= 5:
-                    debug_msg = debug_callback or print
                     debug_msg(f"DEBUG: Item {items_checked} has no subjects. Keys: {list(item.keys())[:20]}")
         
         # Fetch full item details for items that didn't have subjects in search results
         if items_without_subjects and not tag_counts:
             if debug:
-                print(f"DEBUG: No subjects found in search results. Fetching full details for {min(len(items_without_subjects), 100)} items")
+                debug_msg(f"DEBUG: No subjects found in search results. Fetching full details for {min(len(items_without_subjects), 100)} items")
+            base_stripped = base.rstrip("/")
             for idx, item_url in enumerate(items_without_subjects[:100]):  # Limit to 100 to avoid too many requests
                 try:
                     # Extract path from full URL
-                    item_path = item_url.replace(base.rstrip("/"), "").lstrip("/")
+                    item_path = item_url.replace(base_stripped, "").lstrip("/")
                     _, full_item = fetch(item_path, base, {}, {}, no_auth)
-                    
-                    # Try same comprehensive field checking for full items
-                    # Priority: Subject field first (Plone's standard)
-                    subjects = None
-                    if "Subject" in full_item:
-                        subjects = full_item["Subject"]
-                    elif "subject" in full_item:
-                        subjects = full_item["subject"]
-                    elif "@components" in full_item and "Subject" in full_item["@components"]:
-                        subjects = full_item["@components"]["Subject"]
-                    elif "metadata" in full_item and "Subject" in full_item["metadata"]:
-                        subjects = full_item["metadata"]["Subject"]
-                    elif "subjects" in full_item:
-                        subjects = full_item["subjects"]
-                    elif "keywords" in full_item:
-                        subjects = full_item["keywords"]
-                    elif "Keywords" in full_item:
-                        subjects = full_item["Keywords"]
-                    elif "tags" in full_item:
-                        subjects = full_item["tags"]
-                    elif "Tags" in full_item:
-                        subjects = full_item["Tags"]
-                    
-                    if subjects is None:
-                        subjects = []
-                    elif isinstance(subjects, str):
-                        subjects = [subjects] if subjects else []
-                    elif not isinstance(subjects, list):
-                        try:
-                            subjects = list(subjects) if subjects else []
-                        except (TypeError, ValueError):
-                            subjects = []
-                    
-                    subjects = [s for s in subjects if s and isinstance(s, str) and s.strip()]
-                    
+                    subjects = extract_subjects(full_item)
                     if subjects:
-                        for subject in subjects:
-                            subject = subject.strip()
-                            if subject:
-                                tag_counts[subject] = tag_counts.get(subject, 0) + 1
+                        tag_counts.update(subjects)
                         if debug and idx < 5:
-                            debug_msg = debug_callback or print
                             debug_msg(f"DEBUG: Full item fetch {idx+1} found subjects: {subjects}")
                     elif debug and idx < 5:
-                        debug_msg = debug_callback or print
                         debug_msg(f"DEBUG: Full item fetch {idx+1} still has no subjects. Keys: {list(full_item.keys())[:20]}")
                 except Exception as e:
                     if debug and idx < 5:
-                        print(f"DEBUG: Failed to fetch full item {idx+1}: {e}")
+                        debug_msg(f"DEBUG: Failed to fetch full item {idx+1}: {e}")
                     continue
         
         # Handle pagination if there are more results
         items_total = data.get("items_total", len(items))
+        # Each page is counted and then discarded, so only one page is resident at a time
+        items_seen = len(items)
+        # Step by what the server actually returned, in case it caps b_size below what we asked
+        page_size = len(items)
+        del data, items
         
-        # If there are more items, fetch them (up to a reasonable limit)
+        # If there are more items, fetch them (up to a reasonable limit).
+        # The batch offsets are known up front, so several pages are requested at once
+        # and each is counted as it arrives.
         max_items = 10000  # Limit to prevent excessive requests
-        while items_total > len(items) and len(items) < max_items:
-            params["b_start"] = len(items)
-            response = httpx.get(
-                search_url,
-                params=params,
-                headers=headers or None,
-                timeout=15,
-            )
-            response.raise_for_status()
-            page_data = response.json()
-            page_items = page_data.get("items", [])
-            if not page_items:
-                break
+        if page_size and items_total > items_seen:
+            def count_page(page_items: List[Dict[str, Any]]) -> None:
+                for item in page_items:
+                    tag_counts.update(extract_subjects(item, len(tag_counts) < TAG_INTERN_LIMIT))
             
-            for item in page_items:
-                # Priority: Subject field first (Plone's standard)
-                subjects = None
-                if "Subject" in item:
-                    subjects = item["Subject"]
-                elif "subject" in item:
-                    subjects = item["subject"]
-                elif "@components" in item and "Subject" in item["@components"]:
-                    subjects = item["@components"]["Subject"]
-                elif "metadata" in item and "Subject" in item["metadata"]:
-                    subjects = item["metadata"]["Subject"]
-                elif "subjects" in item:
-                    subjects = item["subjects"]
-                elif "keywords" in item:
-                    subjects = item["keywords"]
-                elif "Keywords" in item:
-                    subjects = item["Keywords"]
-                elif "tags" in item:
-                    subjects = item["tags"]
-                elif "Tags" in item:
-                    subjects = item["Tags"]
-                
-                if subjects is None:
-                    subjects = []
-                elif isinstance(subjects, str):
-                    subjects = [subjects] if subjects else []
-                elif not isinstance(subjects, list):
-                    try:
-                        subjects = list(subjects) if subjects else []
-                    except (TypeError, ValueError):
-                        subjects = []
-                
-                subjects = [s for s in subjects if s and isinstance(s, str) and s.strip()]
-                
-                if subjects:
-                    for subject in subjects:
-                        subject = subject.strip()
-                        if subject:
-                            tag_counts[subject] = tag_counts.get(subject, 0) + 1
-        
-            items.extend(page_items)
-            if len(page_items) < params.get("b_size", 1000):
-                break
+            items_seen += _run_sync(_fetch_search_pages_async(
+                search_url,
+                params,
+                headers,
+                range(items_seen, min(items_total, max_items), page_size),
+                count_page,
+            ))
         
         # If we found tags, return them
         if tag_counts:
             if debug:
-                print(f"DEBUG: Found {len(tag_counts)} unique tags via search")
+                debug_msg(f"DEBUG: Found {len(tag_counts)} unique tags via search")
             return tag_counts
         elif debug:
-            print(f"DEBUG: Search succeeded but found no tags in {len(items)} items")
+            debug_msg(f"DEBUG: Search succeeded but found no tags in {items_seen} items")
                 
     except (httpx.HTTPStatusError, httpx.RequestError, Exception) as e:
         if debug:
-            print(f"DEBUG: Search failed: {type(e).__name__}: {e}")
+            debug_msg(f"DEBUG: Search failed: {type(e).__name__}: {e}")
         # Fallback to browsing if search fails or returns no subjects
         pass
     
-    # Fallback: Browse recursively through the site
+    # Fallback: Browse the site tree level by level, fetching each level's folders concurrently
     if not used_search or not tag_counts:
         if warn_callback:
             warn_callback("[yellow]Warning:[/yellow] Search endpoint didn't return tags. Falling back to recursive browsing (this may take a while on large sites)...")
-        
-        # Cache for fetched items to avoid re-fetching
-        item_cache: Dict[str, Dict[str, Any]] = {}
-        visited_paths: set = set()
-        
-        def collect_tags_recursive(current_path: str, depth: int = 0, max_depth: int = 20) -> None:
-            """Recursively collect tags from items with caching."""
-            if current_path in visited_paths or depth > max_depth:
-                return
-            visited_paths.add(current_path)
-            
-            try:
-                # Check cache first
-                if current_path in item_cache:
-                    data = item_cache[current_path]
-                else:
-                    url, data = fetch(current_path, base, {}, {}, no_auth)
-                    item_cache[current_path] = data
-                
-                items = data.get("items", [])
-                
-                for item in items:
-                    # Priority: Subject field first (Plone's standard)
-                    subjects = None
-                    if "Subject" in item:
-                        subjects = item["Subject"]
-                    elif "subject" in item:
-                        subjects = item["subject"]
-                    elif "@components" in item and "Subject" in item["@components"]:
-                        subjects = item["@components"]["Subject"]
-                    elif "metadata" in item and "Subject" in item["metadata"]:
-                        subjects = item["metadata"]["Subject"]
-                    elif "subjects" in item:
-                        subjects = item["subjects"]
-                    elif "keywords" in item:
-                        subjects = item["keywords"]
-                    elif "Keywords" in item:
-                        subjects = item["Keywords"]
-                    elif "tags" in item:
-                        subjects = item["tags"]
-                    elif "Tags" in item:
-                        subjects = item["Tags"]
-                    
-                    if subjects is None:
-                        subjects = []
-                    elif isinstance(subjects, str):
-                        subjects = [subjects] if subjects else []
-                    elif not isinstance(subjects, list):
-                        try:
-                            subjects = list(subjects) if subjects else []
-                        except (TypeError, ValueError):
-                            subjects = []
-                    
-                    subjects = [s for s in subjects if s and isinstance(s, str) and s.strip()]
-                    
-                    if subjects:
-                        for subject in subjects:
-                            subject = subject.strip()
-                            if subject:
-                                tag_counts[subject] = tag_counts.get(subject, 0) + 1
-                    
-                    # If it's a container, recurse into it
-                    if item.get("is_folderish") or item.get("@type") in ("Folder", "Collection"):
-                        item_path = item.get("@id", "").replace(base.rstrip("/"), "").lstrip("/")
-                        if item_path and item_path not in visited_paths:
-                            collect_tags_recursive(item_path, depth + 1, max_depth)
-            except Exception:
-                pass  # Skip if we can't access this path
-        
         try:
-            # Start from the given path or root
-            collect_tags_recursive(path if path else "", max_depth=20)
+            _run_sync(_collect_tags_async(
+                base,
+                path if path else "",
+                no_auth,
+                tag_counts,
+                debug_callback=debug_msg if debug else None,
+            ))
         except Exception:
             pass
     
     return tag_counts
 
 
-def update_item_subjects(base: str, item_path: str, subjects: List[str], no_auth: bool = False) -> Dict[str, Any]:
+def _find_subject_location(item: Dict[str, Any]) -> Tuple[Optional[str], Any, Optional[str]]:
+    """Return where an item keeps its subjects, the current value, and that value's type name."""
+    if "Subject" in item:
+        location, value = "top_level", item["Subject"]
+    elif "subjects" in item:
+        location, value = "top_level_lowercase", item["subjects"]
+    elif "@components" in item and isinstance(item["@components"], dict) and "Subject" in item["@components"]:
+        location, value = "components", item["@components"]["Subject"]
+    elif "@components" in item and isinstance(item["@components"], dict) and "subjects" in item["@components"]:
+        location, value = "components_lowercase", item["@components"]["subjects"]
+    else:
+        return None, None, None
+    return location, value, type(value).__name__
+
+
+def _minimal_subject_update(subjects: List[str], item: Dict[str, Any], location: Optional[str]) -> Any:
+    """Send only the field, in the place the item itself reports it."""
+    if location == "components":
+        return {"@components": {"Subject": subjects}}
+    if location == "components_lowercase":
+        return {"@components": {"subjects": subjects}}
+    return {"Subject": subjects}
+
+
+# Ways of writing subjects that different Plone REST API versions accept, in the order tried:
+# (label for error messages, HTTP verb, URL suffix, body builder, clear the list first)
+# According to official Plone REST API docs, PATCH should use capital S "Subject"
+# even though GET responses show lowercase "subjects"
+_SUBJECT_UPDATE_STRATEGIES: Tuple[Tuple[str, str, str, Callable[[List[str], Dict[str, Any], Optional[str]], Any], bool], ...] = (
+    ("Subject", "PATCH", "", lambda subjects, item, location: {"Subject": subjects}, False),
+    ("subjects", "PATCH", "", lambda subjects, item, location: {"subjects": subjects}, False),
+    ("clear_first", "PATCH", "", lambda subjects, item, location: {"Subject": subjects}, True),
+    ("with_type", "PATCH", "", lambda subjects, item, location: {"@type": item.get("@type"), "Subject": subjects}, False),
+    ("content_patch", "PATCH", "/@content", lambda subjects, item, location: {"Subject": subjects}, False),
+    ("minimal", "PATCH", "", _minimal_subject_update, False),
+    ("content_post", "POST", "/@content", lambda subjects, item, location: {"Subject": subjects}, False),
+    ("field_endpoint", "PATCH", "/@fields/subject", lambda subjects, item, location: subjects, False),
+)
+# base URL -> index of the strategy that last worked there
+_STRATEGY_HINT: Dict[str, int] = {}
+
+
+def update_item_subjects(base: str, item_path: str, subjects: List[str], no_auth: bool = False, verify: bool = False) -> Dict[str, Any]:
     """Update the subjects/tags of an item.
     
     Based on Plone REST API documentation, content updates should use PATCH with the field name
     directly in the JSON body. However, some Plone sites may have custom serializers or require
     different formats.
+    
+    With verify=True, the subjects echoed back by the first PATCH must match what was sent,
+    otherwise the fallback approaches are tried.
     """
     # Ensure base is a string (handle Typer Option objects)
     if not isinstance(base, str):
         base = get_base_url(None)
-    url = resolve_url(item_path, base)
-    
-    # First, fetch the current item to understand its structure
-    # According to Plone REST API docs, GET returns "subjects" (lowercase) as an array
-    # But PATCH should use "Subject" (capital S) with an array
-    try:
-        _, current_item = fetch(item_path, base, {}, {}, no_auth)
-    except Exception as e:
-        raise APIError(f"Could not fetch item to determine structure: {e}") from e
-    
-    # Try to get schema information if available (some Plone REST API versions expose this)
-    # This can help us understand what fields are available and how they should be updated
-    schema_info = None
-    try:
-        schema_url = url.rstrip("/") + "/@schema"
-        _, schema_data = fetch(schema_url, base, {}, {}, no_auth)
-        schema_info = schema_data
-        # Check if Subject field is in schema and what its properties are
-        if isinstance(schema_data, dict) and "properties" in schema_data:
-            subject_props = schema_data["properties"].get("Subject") or schema_data["properties"].get("subjects")
-            if subject_props:
-                # Log schema info for debugging (we can use this later)
-                pass
-    except Exception:
-        # Schema endpoint might not be available, that's okay
-        pass
     
-    # Check where Subject field actually is in the response and its format
-    subject_location = None
-    current_subjects_value = None
-    subjects_type = None
-    
-    if "Subject" in current_item:
-        subject_location = "top_level"
-        current_subjects_value = current_item["Subject"]
-        subjects_type = type(current_subjects_value).__name__
-    elif "subjects" in current_item:
-        subject_location = "top_level_lowercase"
-        current_subjects_value = current_item["subjects"]
-        subjects_type = type(current_subjects_value).__name__
-    elif "@components" in current_item and isinstance(current_item["@components"], dict):
-        components = current_item["@components"]
-        if "Subject" in components:
-            subject_location = "components"
-            current_subjects_value = components["Subject"]
-            subjects_type = type(current_subjects_value).__name__
-        elif "subjects" in components:
-            subject_location = "components_lowercase"
-            current_subjects_value = components["subjects"]
-            subjects_type = type(current_subjects_value).__name__
-        # Check what's actually in @components for debugging
-        component_keys = list(components.keys()) if isinstance(components, dict) else []
+    invalidate_tag_cache()
+    url = resolve_url(item_path, base)
     
     # Try different approaches based on what the API expects
     # Plone REST API might need the field in different formats
@@ -998,120 +1416,143 @@ def update_item_subjects(base: str, item_path: str, subjects: List[str], no_auth
     # Ensure subjects is a clean list of strings
     if not isinstance(subjects, list):
         subjects = list(subjects)
-    # Ensure all items are strings and filter out empty values
-    subjects = [str(s).strip() for s in subjects if s and str(s).strip()]
+    # Ensure all items are strings and filter out empty values, converting and stripping each once
+    subjects = [t for t in (str(s).strip() for s in subjects if s) if t]
     
-    # Approach 1: Use "Subject" (capital S) with list of strings - this is the documented format
-    # According to official Plone REST API docs, PATCH should use capital S "Subject"
-    # even though GET responses show lowercase "subjects"
-    try:
-        result = patch(url, base, {"Subject": subjects}, {}, no_auth)[1]
-        # Verify the update by checking if subjects were actually updated in the response
-        # Some APIs return success but don't actually update
-        if isinstance(result, dict):
-            updated_subjects = result.get("Subject") or result.get("subjects", [])
-            if isinstance(updated_subjects, str):
-                updated_subjects = [updated_subjects]
-            # Check if the update actually took effect
-            if set(updated_subjects) != set(subjects):
-                # Update didn't match what we sent - the server returned success but didn't update
-                # This is a server-side issue - raise an error so the caller knows
-                raise APIError(
-                    f"PATCH request returned success but subjects were not updated. "
-                    f"Sent: {subjects}, Got back: {updated_subjects}. "
-                    f"This indicates the server accepted the request but did not apply the changes."
-                )
-        return result
-    except APIError as e1:
-        # Check if this is the __getitem__ error we've been seeing
-        if "__getitem__" in str(e1) or "500" in str(e1):
-            # This is the known server-side error - continue to fallback approaches
-            pass
-        else:
-            # Some other error - might be worth trying fallbacks too
-            pass
-        # Approach 2: Try with "subjects" (lowercase - as it appears in some API responses)
-        # Some REST API serializers use lowercase field names in responses but may accept both
-        try:
-            return patch(url, base, {"subjects": subjects}, {}, no_auth)[1]
-        except APIError as e2:
-            # The __getitem__ AttributeError persists even with the documented format.
-            # This strongly suggests a server-side issue. Let's try a few more things:
-            
-            # Approach 2b: Try with empty list first, then set subjects (workaround for some serializer bugs)
+    base_key = base.rstrip("/")
+    url_stripped = url.rstrip("/")
+    hint = _STRATEGY_HINT.get(base_key, 0)
+    order = [hint] + [index for index in range(len(_SUBJECT_UPDATE_STRATEGIES)) if index != hint]
+    
+    errors: List[Tuple[str, APIError]] = []
+    current_item: Optional[Dict[str, Any]] = None
+    subject_location: Optional[str] = None
+    for index in order:
+        label, verb, suffix, build_body, clear_first = _SUBJECT_UPDATE_STRATEGIES[index]
+        if current_item is None and (errors or index != 0):
+            # Past the documented format, so now fetch the item to understand its structure
+            # According to Plone REST API docs, GET returns "subjects" (lowercase) as an array
+            # But PATCH should use "Subject" (capital S) with an array
             try:
+                _, current_item = fetch(item_path, base, {}, {}, no_auth)
+            except Exception as e:
+                if not errors:
+                    raise APIError(f"Could not fetch item to determine structure: {e}") from e
+                raise APIError(f"Failed to update subjects ({errors[0][1]}) and could not fetch item to determine structure: {e}") from e
+            subject_location = _find_subject_location(current_item)[0]
+        
+        target = url_stripped + suffix if suffix else url
+        send = post if verb == "POST" else patch
+        try:
+            if clear_first:
                 # Some serializers have issues with updating non-empty lists, try clearing first
-                patch(url, base, {"Subject": []}, {}, no_auth)
-                return patch(url, base, {"Subject": subjects}, {}, no_auth)[1]
-            except APIError:
-                pass
-            
-            # Approach 2c: Try including @type (some serializers need this to identify content type)
-            try:
-                update_data = {
-                    "@type": current_item.get("@type"),
-                    "Subject": subjects
-                }
-                return patch(url, base, update_data, {}, no_auth)[1]
-            except APIError:
-                pass
-            
-            # Approach 3: Try using @content endpoint if available
-            content_url = url.rstrip("/") + "/@content"
+                send(target, base, {"Subject": []}, {}, no_auth)
+            result = send(target, base, build_body(subjects, current_item or {}, subject_location), {}, no_auth)[1]
+            # Verify the update by checking if subjects were actually updated in the response
+            # Some APIs return success but don't actually update (only checked for the documented format)
+            if verify and index == 0 and isinstance(result, dict):
+                updated_subjects = result.get("Subject") or result.get("subjects", [])
+                if isinstance(updated_subjects, str):
+                    updated_subjects = [updated_subjects]
+                # Check if the update actually took effect
+                if set(updated_subjects) != set(subjects):
+                    # Update didn't match what we sent - the server returned success but didn't update
+                    # This is a server-side issue - raise an error so the caller knows
+                    raise APIError(
+                        f"PATCH request returned success but subjects were not updated. "
+                        f"Sent: {subjects}, Got back: {updated_subjects}. "
+                        f"This indicates the server accepted the request but did not apply the changes."
+                    )
+        except APIError as e:
+            errors.append((label, e))
+            continue
+        # Remember which format this site accepts so the next update tries it first
+        _STRATEGY_HINT[base_key] = index
+        return result
+    
+    # If all approaches fail, provide detailed error with component info
+    if current_item is None:
+        current_item = {}
+    _, current_subjects_value, subjects_type = _find_subject_location(current_item)
+    component_info = ""
+    if "@components" in current_item and isinstance(current_item["@components"], dict):
+        component_info = f"@components keys: {list(current_item['@components'].keys())[:10]}"
+    
+    # Build detailed error message
+    current_subjects_info = ""
+    if current_subjects_value is not None:
+        current_subjects_info = f"Current subjects value type: {subjects_type}, value: {current_subjects_value[:3] if isinstance(current_subjects_value, (list, tuple)) and len(current_subjects_value) > 3 else current_subjects_value}"
+    
+    # Schema information is only needed for this diagnostic, so fetch it last
+    # (some Plone REST API versions expose @schema, others don't)
+    schema_info = None
+    try:
+        _, schema_info = fetch(url_stripped + "/@schema", base, {}, {}, no_auth)
+    except Exception:
+        # Schema endpoint might not be available, that's okay
+        pass
+    
+    # Final error message with all diagnostic information
+    schema_info_text = ""
+    if schema_info:
+        schema_info_text = f"Schema available: {bool(schema_info)}. "
+    
+    error_text = ", ".join(f"{label}={error}" for label, error in errors)
+    raise APIError(
+        f"Failed to update subjects using the documented Plone REST API format. "
+        f"According to official docs, PATCH with {{'Subject': ['tag1', 'tag2']}} should work. "
+        f"Tried: 'Subject' (capital S with list), 'subjects' (lowercase), clearing first, including @type, '@content' endpoint, minimal update, POST, and field endpoint. "
+        f"Subject location in item: {subject_location}. {current_subjects_info}. {component_info}. {schema_info_text}"
+        f"Errors: {error_text}. "
+        f"Item structure keys: {list(current_item.keys())[:20]}. "
+        f"The persistent '__getitem__' AttributeError (500) suggests a server-side issue. "
+        f"This could be: (1) a bug in the Plone REST API version on this server, "
+        f"(2) the Subject field is not included in writable fields for this content type, "
+        f"or (3) a custom serializer issue. "
+        f"Recommendation: Check server logs or contact the site administrator about Subject field updates via REST API."
+    ) from errors[-1][1]
+
+
+def update_items_subjects(
+    base: str,
+    updates: Dict[str, List[str]],
+    concurrency: int = UPDATE_CONCURRENCY,
+    no_auth: bool = False,
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, APIError]]:
+    """Update the subjects of many items concurrently.
+    
+    Args:
+        base: Base API URL
+        updates: Mapping of item path to its new list of subjects
+        concurrency: Maximum number of updates in flight at once
+        no_auth: Whether to skip authentication
+        
+    Returns:
+        (results, errors): response data per successfully updated path, and the
+        APIError per path that could not be updated
+    """
+    # Ensure base is a string
+    if not isinstance(base, str):
+        base = get_base_url(None)
+    
+    results: Dict[str, Dict[str, Any]] = {}
+    errors: Dict[str, APIError] = {}
+    if not updates:
+        return results, errors
+    
+    # Each update runs the full single-item fallback logic; the threads share the pooled client
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(updates)))) as executor:
+        futures = {
+            executor.submit(update_item_subjects, base, item_path, subjects, no_auth): item_path
+            for item_path, subjects in updates.items()
+        }
+        for future in as_completed(futures):
+            item_path = futures[future]
             try:
-                return patch(content_url, base, {"Subject": subjects}, {}, no_auth)[1]
-            except APIError as e3:
-                # Approach 4: Try with minimal update - only send what's needed
-                # Some Plone REST API versions require only the fields being updated
-                try:
-                    # Try with just the field name that matches where it was found
-                    if subject_location == "components":
-                        update_data = {"@components": {"Subject": subjects}}
-                    elif subject_location == "components_lowercase":
-                        update_data = {"@components": {"subjects": subjects}}
-                    else:
-                        update_data = {"Subject": subjects}
-                    return patch(url, base, update_data, {}, no_auth)[1]
-                except APIError as e4:
-                    # Approach 5: Try POST to @content endpoint (some APIs use POST for updates)
-                    try:
-                        return post(content_url, base, {"Subject": subjects}, {}, no_auth)[1]
-                    except APIError as e5:
-                        # Approach 6: Check if there's a @types endpoint that shows how to update
-                        # Some Plone REST API versions require using specific field update endpoints
-                        # Try using the field name directly in the path
-                        try:
-                            field_url = url.rstrip("/") + "/@fields/subject"
-                            return patch(field_url, base, subjects, {}, no_auth)[1]
-                        except APIError as e6:
-                            # If all approaches fail, provide detailed error with component info
-                            component_info = ""
-                            if "@components" in current_item and isinstance(current_item["@components"], dict):
-                                component_info = f"@components keys: {list(current_item['@components'].keys())[:10]}"
-                            
-                            # Build detailed error message
-                            current_subjects_info = ""
-                            if current_subjects_value is not None:
-                                current_subjects_info = f"Current subjects value type: {subjects_type}, value: {current_subjects_value[:3] if isinstance(current_subjects_value, (list, tuple)) and len(current_subjects_value) > 3 else current_subjects_value}"
-                            
-                            # Final error message with all diagnostic information
-                            schema_info_text = ""
-                            if schema_info:
-                                schema_info_text = f"Schema available: {bool(schema_info)}. "
-                            
-                            raise APIError(
-                                f"Failed to update subjects using the documented Plone REST API format. "
-                                f"According to official docs, PATCH with {{'Subject': ['tag1', 'tag2']}} should work. "
-                                f"Tried: 'Subject' (capital S with list), 'subjects' (lowercase), '@content' endpoint, minimal update, POST, and field endpoint. "
-                                f"Subject location in item: {subject_location}. {current_subjects_info}. {component_info}. {schema_info_text}"
-                                f"Errors: Subject={e1}, subjects={e2}, content_patch={e3}, minimal={e4}, content_post={e5}, field_endpoint={e6}. "
-                                f"Item structure keys: {list(current_item.keys())[:20]}. "
-                                f"The persistent '__getitem__' AttributeError (500) suggests a server-side issue. "
-                                f"This could be: (1) a bug in the Plone REST API version on this server, "
-                                f"(2) the Subject field is not included in writable fields for this content type, "
-                                f"or (3) a custom serializer issue. "
-                                f"Recommendation: Check server logs or contact the site administrator about Subject field updates via REST API."
-                            ) from e6
+                results[item_path] = future.result()
+            except APIError as exc:
+                errors[item_path] = exc
+    return results, errors
 
 
 def move_item(base: str, source_path: str, dest_path: str, new_id: Optional[str] = None, no_auth: bool = False) -> Dict[str, Any]:
@@ -1131,6 +1572,8 @@ def move_item(base: str, source_path: str, dest_path: str, new_id: Optional[str]
     if not isinstance(base, str):
         base = get_base_url(None)
     
+    invalidate_tag_cache()
+    
     # Resolve source and destination URLs
     source_url = resolve_url(source_path, base)
     dest_url = resolve_url(dest_path, base)
@@ -1147,11 +1590,11 @@ def move_item(base: str, source_path: str, dest_path: str, new_id: Optional[str]
     
     # Use @move endpoint: POST to destination/@move with source reference
     move_url = dest_url.rstrip("/") + "/@move"
-    prepared_headers = apply_auth({}, base, no_auth)
-    if "Content-Type" not in prepared_headers:
-        prepared_headers["Content-Type"] = "application/json"
-    if "Accept" not in prepared_headers:
-        prepared_headers["Accept"] = "application/json"
+    prepared_headers = {
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+        **apply_auth({}, base, no_auth),
+    }
     
     # Build move payload
     move_data = {"source": source_url}
@@ -1159,7 +1602,7 @@ def move_item(base: str, source_path: str, dest_path: str, new_id: Optional[str]
         move_data["id"] = new_id
     
     try:
-        response = httpx.post(
+        response = _get_client().post(
             move_url,
             json=move_data,
             headers=prepared_headers or None,
@@ -1169,7 +1612,7 @@ def move_item(base: str, source_path: str, dest_path: str, new_id: Optional[str]
     except httpx.HTTPStatusError as exc:
         error_msg = f"Move failed with status {exc.response.status_code} for {move_url}"
         try:
-            error_data = exc.response.json()
+            error_data = json_loads(exc.response.content)
             if "message" in error_data:
                 error_msg += f": {error_data['message']}"
             elif "error" in error_data:
@@ -1181,12 +1624,25 @@ def move_item(base: str, source_path: str, dest_path: str, new_id: Optional[str]
         raise APIError(f"Unable to reach {move_url}: {exc}") from exc
     
     try:
-        data = response.json() if response.content else {}
+        data = json_loads(response.content) if response.content else {}
     except ValueError:
         data = {}
     return data
 
 
+@lru_cache(maxsize=None)
+def _numpy() -> Any:
+    """Import numpy on first use (it is slow to import and only the all-pairs scorer needs it).
+    
+    Returns None when numpy is unavailable; similar-tag pairs are then scored in Python.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
 def find_similar_tags(base: str, query_tag: Optional[str] = None, path: str = "", threshold: int = 70, no_auth: bool = False) -> List[Tuple[str, int, int, Optional[str]]]:
     """
     Find tags similar to the query tag using fuzzy matching.
@@ -1207,17 +1663,25 @@ def find_similar_tags(base: str, query_tag: Optional[str] = None, path: str = ""
     if not tag_counts:
         return []
     
+    from rapidfuzz import fuzz as rf_fuzz, process as rf_process
+    
     # If query tag is provided, find tags similar to it
     if query_tag:
+        # Case-insensitive ratio (0-100) against every tag, scored natively.
+        # thefuzz rounds the float ratio to an int, so anything that rounds up to threshold counts
+        matches = rf_process.extract(
+            query_tag,
+            list(tag_counts),
+            scorer=rf_fuzz.ratio,
+            processor=str.lower,
+            score_cutoff=max(threshold - 0.5, 0),
+            limit=None,
+        )
         similar_tags: List[Tuple[str, int, int, Optional[str]]] = []
-        query_lower = query_tag.lower()
-        
-        for tag, count in tag_counts.items():
-            # Calculate similarity using ratio (0-100)
-            similarity = fuzz.ratio(query_lower, tag.lower())
-            
+        for tag, score, _ in matches:
+            similarity = round(score)
             if similarity >= threshold:
-                similar_tags.append((tag, count, similarity, None))
+                similar_tags.append((tag, tag_counts[tag], similarity, None))
         
         # Sort by similarity (descending), then by frequency (descending), then alphabetically
         similar_tags.sort(key=lambda x: (-x[2], -x[1], x[0].lower()))
@@ -1227,18 +1691,67 @@ def find_similar_tags(base: str, query_tag: Optional[str] = None, path: str = ""
     similar_pairs: List[Tuple[str, int, int, str]] = []
     tag_list = list(tag_counts.items())
     
-    # Compare all pairs of tags
-    for i, (tag1, count1) in enumerate(tag_list):
-        for tag2, count2 in tag_list[i + 1:]:
-            similarity = fuzz.ratio(tag1.lower(), tag2.lower())
-            
-            if similarity >= threshold:
-                # Add both tags (we'll deduplicate later)
-                # Prefer the tag with higher frequency as the "matched" tag
+    _np = _numpy()
+    if _np is not None:
+        # Score natively, a block of rows at a time so memory stays at SIMILAR_TAGS_BLOCK x N;
+        # pairs are visited in the same (i, j) order as the loop below
+        lowers = [tag.lower() for tag, _ in tag_list]
+        for start in range(0, len(lowers) - 1, SIMILAR_TAGS_BLOCK):
+            stop = min(start + SIMILAR_TAGS_BLOCK, len(lowers) - 1)
+            # Rows start..stop-1 against the tags after start; column c is tag start + 1 + c
+            # thefuzz rounds rapidfuzz's float ratio to an int, so anything that rounds up to threshold counts
+            scores = rf_process.cdist(
+                lowers[start:stop],
+                lowers[start + 1:],
+                scorer=rf_fuzz.ratio,
+                score_cutoff=max(threshold - 0.5, 0),
+                dtype=_np.float32,
+                workers=-1,
+            )
+            _np.rint(scores, out=scores)
+            for row, col in _np.argwhere(scores >= threshold):
+                # Only the upper triangle (j > i): each pair once, never a tag against itself
+                if col < row:
+                    continue
+                i, j = start + row, start + 1 + col
+                tag1, count1 = tag_list[i]
+                tag2, count2 = tag_list[j]
+                similarity = int(scores[row, col])
                 if count1 >= count2:
                     similar_pairs.append((tag1, count1, similarity, tag2))
                 else:
                     similar_pairs.append((tag2, count2, similarity, tag1))
+        similar_pairs.sort(key=lambda x: (-x[2], -x[1], x[0].lower()))
+        return similar_pairs
+    
+    # Compare pairs of tags, lower-casing each tag once rather than per comparison.
+    # For lengths la <= lb, ratio can be at most 200 * la / (la + lb), so with the
+    # tags sorted by length the inner scan stops once the longer tag is too long.
+    from thefuzz import fuzz
+    
+    cutoff = threshold - 0.5  # thefuzz rounds, so a score of cutoff may still reach threshold
+    lowers = [tag.lower() for tag, _ in tag_list]
+    by_length = sorted((len(lower), index, lower) for index, lower in enumerate(lowers))
+    matches: List[Tuple[int, int, int]] = []
+    for pos, (len1, index1, lower1) in enumerate(by_length):
+        max_len = len1 * (200 - cutoff) / cutoff if cutoff > 0 else None
+        for len2, index2, lower2 in by_length[pos + 1:]:
+            if max_len is not None and len2 > max_len:
+                break
+            similarity = fuzz.ratio(lower1, lower2)
+            if similarity >= threshold:
+                matches.append((min(index1, index2), max(index1, index2), similarity))
+    
+    # Emit pairs in the original tag order so ties sort exactly as before
+    matches.sort()
+    for index1, index2, similarity in matches:
+        tag1, count1 = tag_list[index1]
+        tag2, count2 = tag_list[index2]
+        # Prefer the tag with higher frequency as the "matched" tag
+        if count1 >= count2:
+            similar_pairs.append((tag1, count1, similarity, tag2))
+        else:
+            similar_pairs.append((tag2, count2, similarity, tag1))
     
     # Sort by similarity (descending), then by frequency (descending)
     similar_pairs.sort(key=lambda x: (-x[2], -x[1], x[0].lower()))
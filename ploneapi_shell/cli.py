@@ -7,30 +7,31 @@ Most modern Plone 6.x sites expose their REST API at siteroot/++api++
 
 from __future__ import annotations
 
-import json
+import atexit
 import os
 import sys
+import threading
 import time
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import AbstractSet, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 import posixpath
 import shlex
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 
 import typer
 from rich import box
 from rich.console import Console
-from rich.json import JSON
 from rich.table import Table
-
-from prompt_toolkit import prompt
-from prompt_toolkit.completion import Completer, Completion
-from prompt_toolkit.history import FileHistory
+from rich.text import Text
 
 from ploneapi_shell import api, __version__
 
 CONFIG_FILE = api.CONFIG_FILE
-HISTORY_FILE = CONFIG_FILE.parent / "history.txt"
 VERSION_MESSAGE = f"[dim]ploneapi-shell v{__version__}[/dim]"
 
 APP = typer.Typer(
@@ -39,6 +40,13 @@ APP = typer.Typer(
 )
 CONSOLE = Console()
 DEFAULT_BASE = api.DEFAULT_BASE
+LS_PAGE_SIZE = 50  # items per batch for the REPL's ls/next/prev
+LS_PREFETCH_FOLDERS = 5  # subfolders whose completions ls warms in the background
+LS_MAX_ROWS = 500  # ls renders at most this many rows; the rest are summarised in a footer
+LS_REUSE_TTL = 30.0  # seconds the folder cd fetched stays good enough for the next ls
+# Catalog metadata ls and completion read from each item, beyond Plone's default item summary
+LS_FIELDS = ["id", "modified", "is_folderish"]
+_SUMMARY_FIELDS = ("@id", "@type", "title", "description", "review_state")
 
 
 class CliError(typer.Exit):
@@ -49,12 +57,17 @@ class CliError(typer.Exit):
         super().__init__(code)
 
 
+def _history_file() -> Path:
+    """REPL history lives next to the config file; only the REPL needs the path."""
+    return CONFIG_FILE.parent / "history.txt"
+
+
 def parse_key_values(entries: Iterable[str]) -> Dict[str, str]:
     result: Dict[str, str] = {}
     for raw in entries:
-        if ":" not in raw:
+        key, sep, value = raw.partition(":")
+        if not sep:
             raise CliError(f"Invalid key/value pair '{raw}'. Use key:value syntax.")
-        key, value = raw.split(":", 1)
         result[key.strip()] = value.strip()
     return result
 
@@ -68,8 +81,8 @@ def save_config(data: Dict[str, Any]) -> None:
     api.save_config(data)
 
 
-def delete_config() -> None:
-    api.delete_config()
+def delete_config() -> bool:
+    return api.delete_config()
 
 
 def get_base_url(provided: Optional[str] = None) -> str:
@@ -95,11 +108,12 @@ def fetch(
     path_or_url: str | None,
     base: str,
     headers: Dict[str, str],
-    params: Dict[str, str],
+    params: Dict[str, Any],
     no_auth: bool = False,
+    cache: bool = False,
 ) -> Tuple[str, Dict]:
     try:
-        return api.fetch(path_or_url, base, headers, params, no_auth)
+        return api.fetch(path_or_url, base, headers, params, no_auth, cache=cache)
     except api.APIError as e:
         raise CliError(str(e)) from e
 
@@ -131,64 +145,190 @@ def patch(
 
 
 def dump_raw(data: Dict) -> None:
-    CONSOLE.print(JSON.from_data(data, indent=2))
+    payload = api.json_dumps(data, indent=True)
+    if not CONSOLE.is_terminal:
+        # Piped or redirected: skip the highlighter (colour codes would be dropped anyway)
+        # and Rich's line folding, which would break long strings across lines
+        out = getattr(sys.stdout, "buffer", None)
+        if out is None:
+            sys.stdout.write(payload.decode("utf-8") + "\n")
+            return
+        # The bytes go straight to the binary stream, after any text already printed
+        sys.stdout.flush()
+        out.write(payload + b"\n")
+        out.flush()
+        return
+    from rich.highlighter import JSONHighlighter
+    
+    # What rich.json.JSON.from_data renders, but serialized by api.json_dumps (orjson when installed)
+    text = JSONHighlighter()(payload.decode("utf-8"))
+    text.no_wrap = True
+    text.overflow = None
+    CONSOLE.print(text)
+
+
+def _render_rows(table: Table, rows: Iterable[Tuple[str, ...]], plain: bool = False) -> None:
+    """Print rows into ``table``, or as tab-separated lines when output is not a terminal (or ``plain`` is set).
+
+    Tab-separated rows are written as they are produced, so ``rows`` may be a generator.
+    """
+    if plain or not CONSOLE.is_terminal:
+        # Piped or redirected: plain tab-separated lines are faster than rendering a table and easier to process
+        sys.stdout.writelines(
+            "\t".join(" ".join(str(value).split()) for value in row) + "\n" for row in rows
+        )
+        return
+    for row in rows:
+        table.add_row(*row)
+    CONSOLE.print(table)
 
 
 def print_summary(data: Dict) -> None:
-    fields = ["@id", "@type", "title", "description", "review_state"]
-    table = Table(title="Content Summary", show_header=False, box=box.SIMPLE)
-    for field in fields:
-        if value := data.get(field):
-            table.add_row(field, str(value))
-    if table.row_count:
-        CONSOLE.print(table)
+    rows = [(field, str(value)) for field in _SUMMARY_FIELDS if (value := data.get(field))]
+    if not rows:
+        return
+    _render_rows(Table(title="Content Summary", show_header=False, box=box.SIMPLE), rows)
 
 
-def print_items(items: List[Dict]) -> None:
-    table = Table(title=f"{len(items)} result(s)", box=box.MINIMAL_DOUBLE_HEAD)
+def print_items(items: Iterable[Dict], plain: bool = False) -> None:
+    rows = ((item.get("title", "—"), item.get("@type", "—"), item.get("@id", "—")) for item in items)
+    table = Table(box=box.MINIMAL_DOUBLE_HEAD)
     table.add_column("Title", overflow="fold")
     table.add_column("Type", style="cyan", width=18)
     table.add_column("URL", overflow="fold")
+    if CONSOLE.is_terminal and not plain:
+        # Only the table needs the count up front; plain output streams the rows
+        rows = list(rows)
+        table.title = f"{len(rows)} result(s)"
+    _render_rows(table, rows, plain)
+
+
+def print_components(components: Dict[str, Any]) -> None:
+    rows = [(name, meta.get("@id", "—")) for name, meta in components.items()]
+    table = Table(title="Available components", box=box.MINIMAL)
+    table.add_column("Name", style="bold")
+    table.add_column("Endpoint")
+    _render_rows(table, rows)
+
+
+def _rel_path(item_id: str, base_prefix: str) -> str:
+    """Return item_id relative to base_prefix (a base URL without its trailing slash)."""
+    if item_id.startswith(base_prefix):
+        item_id = item_id[len(base_prefix):]
+    return item_id.lstrip("/")
+
+
+def _merged_tags(tags: List[str], source_tags: AbstractSet[str], target_tag: str) -> List[str]:
+    """Return tags without any of source_tags, with target_tag appended if it is missing."""
+    new_tags = [tag for tag in tags if tag not in source_tags]
+    if target_tag not in new_tags:
+        new_tags.append(target_tag)
+    return new_tags
+
+
+def _subject_updates(
+    items: Iterable[Dict[str, Any]],
+    base_prefix: str,
+    transform: Callable[[List[str]], List[str]],
+) -> Dict[str, List[str]]:
+    """Map each search result's path to transform(its subjects), leaving out items it would not change.
+    
+    Items without a "subjects" list (see api.fill_subjects) are left out too, rather than overwritten.
+    """
+    updates: Dict[str, List[str]] = {}
     for item in items:
-        table.add_row(item.get("title", "—"), item.get("@type", "—"), item.get("@id", "—"))
-    CONSOLE.print(table)
+        current_tags = item.get("subjects")
+        if current_tags is None:
+            continue
+        new_tags = transform(current_tags)
+        if new_tags != current_tags:
+            updates[_rel_path(item.get("@id", ""), base_prefix)] = new_tags
+    return updates
+
+
+def _first_key(item: Dict[str, Any], keys: Tuple[str, ...], default: Any = "—") -> Any:
+    """Value of the first of keys present in item (even if falsy), else default.
+    
+    Same result as nested item.get(a, item.get(b, default)), without evaluating the fallbacks eagerly.
+    """
+    for key in keys:
+        if key in item:
+            return item[key]
+    return default
 
 
-def print_items_with_metadata(items: List[Dict]) -> None:
-    """Print items with rich metadata for ls command."""
+@lru_cache(maxsize=512)
+def _fmt_iso(value: str) -> str:
+    try:
+        # fromisoformat only accepts a trailing "Z" from Python 3.11 on
+        return datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value).strftime("%Y-%m-%d %H:%M")
+    except ValueError:
+        return value
+
+
+def _fmt_ts(value: Any) -> Any:
+    """Format an ISO timestamp as 'YYYY-MM-DD HH:MM'; anything unparseable is returned unchanged."""
+    if not value or value == "—" or not isinstance(value, str):
+        return value
+    # Listings repeat the same timestamps a lot, so formatted strings are memoized
+    return _fmt_iso(value)
+
+
+def _metadata_row(item: Dict) -> Tuple[Any, Any, Any, Any, Any]:
+    """Return (title, id, type, state, modified) of an item as shown by ls."""
+    # Extract title - try multiple field names
+    title = item.get("title") or item.get("Title") or item.get("name") or "—"
+    # Extract ID - try id field first, then extract from @id URL, then try other fields
+    item_id = item.get("id") or item.get("Id") or item.get("UID")
+    if not item_id:
+        # Extract from @id URL (e.g., "https://site.com/++api++/folder/item" -> "item")
+        item_url = item.get("@id", "")
+        if item_url:
+            item_id = item_url.rstrip("/").split("/")[-1] or ""
+    item_id = item_id or "—"
+    # Extract type
+    item_type = _first_key(item, ("@type", "type_title"))
+    state = item.get("review_state", "—")
+    modified = _fmt_ts(_first_key(item, ("modified", "effective")))
+    return title, item_id, item_type, state, modified
+
+
+def print_items_with_metadata(items: List[Dict], plain: bool = False) -> None:
+    """Print items with rich metadata for ls command.
+    
+    With ``plain``, write tab-separated title, ID, type, state and modified lines instead of a table.
+    """
     if not items:
         CONSOLE.print("[dim]No items[/dim]")
         return
     table = Table(box=box.MINIMAL_DOUBLE_HEAD)
-    table.add_column("Title (ID)", overflow="fold", style="bold")
-    table.add_column("State", style="yellow", width=12)
-    table.add_column("Modified", style="dim", width=20)
-    for item in items:
-        # Extract title - try multiple field names
-        title = item.get("title") or item.get("Title") or item.get("name") or "—"
-        # Extract ID - try id field first, then extract from @id URL, then try other fields
-        item_id = item.get("id") or item.get("Id") or item.get("UID")
-        if not item_id:
-            # Extract from @id URL (e.g., "https://site.com/++api++/folder/item" -> "item")
-            item_url = item.get("@id", "")
-            if item_url:
-                item_id = item_url.rstrip("/").split("/")[-1] or ""
-        item_id = item_id or "—"
-        # Extract type
-        item_type = item.get("@type", item.get("type_title", "—"))
-        # Combine title, ID, and type with color distinction: title in bold, ID in dim, type in cyan
-        title_with_id_type = f"[bold]{title}[/bold] [dim]({item_id})[/dim] [cyan][{item_type}][/cyan]"
-        state = item.get("review_state", "—")
-        modified = item.get("modified", item.get("effective", "—"))
-        if modified and modified != "—":
-            try:
-                from datetime import datetime
-                dt = datetime.fromisoformat(modified.replace("Z", "+00:00"))
-                modified = dt.strftime("%Y-%m-%d %H:%M")
-            except (ValueError, AttributeError):
-                pass
-        table.add_row(title_with_id_type, state, modified)
-    CONSOLE.print(table)
+    if plain:
+        # Keep null values as empty fields rather than the text "None"
+        rows = (
+            tuple("" if value is None else value for value in _metadata_row(item))
+            for item in items[:LS_MAX_ROWS]
+        )
+        _render_rows(table, rows, plain=True)
+    else:
+        table.add_column("Title (ID)", overflow="fold", style="bold")
+        table.add_column("State", style="yellow", width=12)
+        table.add_column("Modified", style="dim", width=20)
+        for item in items[:LS_MAX_ROWS]:
+            title, item_id, item_type, state, modified = _metadata_row(item)
+            # Combine title, ID, and type with color distinction: title in bold, ID in dim, type in cyan.
+            # Plain Text cells skip Rich's markup parser (and keep brackets in titles intact).
+            title_with_id_type = Text.assemble(
+                (str(title), "bold"), " ", (f"({item_id})", "dim"), " ", (f"[{item_type}]", "cyan")
+            )
+            # Keep null values as empty cells rather than the text "None"
+            table.add_row(
+                title_with_id_type,
+                Text(str(state)) if state is not None else None,
+                Text(str(modified)) if modified is not None else None,
+            )
+        CONSOLE.print(table)
+    if len(items) > LS_MAX_ROWS:
+        CONSOLE.print(f"[dim]… {len(items) - LS_MAX_ROWS} more item(s) not shown[/dim]")
 
 
 def common_options(
@@ -210,6 +350,7 @@ def cmd_get(
     base: Optional[str] = typer.Option(None, "--base", help="Override the API base URL (defaults to saved config or example site)."),
     raw: bool = typer.Option(False, "--raw", help="Output raw JSON."),
     no_auth: bool = typer.Option(False, "--no-auth", help="Skip saved auth headers for this call."),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Skip the local response cache and fetch a fresh copy."),
     headers: Optional[List[str]] = typer.Option(
         None,
         "--header",
@@ -225,29 +366,37 @@ def cmd_get(
 ) -> None:
     raw_flag, header_map, param_map = common_options(raw, headers, params)
     resolved_base = get_base_url(base)
-    url, data = fetch(path_or_url, resolved_base, header_map, param_map, no_auth=no_auth)
+    url, data = fetch(path_or_url, resolved_base, header_map, param_map, no_auth=no_auth, cache=not no_cache)
     CONSOLE.print(f"[green]GET[/green] {url}")
     if raw_flag:
         dump_raw(data)
         return
     print_summary(data)
-    items = data.get("items") or data.get("results")
+    # data is not used again, so strip the listings in place
+    items = data.pop("items", None)
+    results = data.pop("results", None)
+    items = items or results
     if isinstance(items, list) and items:
         print_items(items)
     else:
-        dump_raw({k: v for k, v in data.items() if k not in {"items", "results"}})
+        dump_raw(data)
 
 
 @APP.command("items")
 def cmd_items(
     path_or_url: str = typer.Argument(..., help="Path or URL expected to return an 'items' array."),
-    limit: int = typer.Option(0, "--limit", "-l", help="Limit number of rows displayed."),
+    limit: int = typer.Option(0, "--limit", "-l", min=0, help="Limit number of rows displayed."),
     base: Optional[str] = typer.Option(None, "--base", help="Override the API base URL (defaults to saved config or example site)."),
     raw: bool = typer.Option(False, "--raw", help="Output raw JSON instead of table."),
+    plain: bool = typer.Option(False, "--plain", help="Output tab-separated title, type and URL lines instead of a table."),
     no_auth: bool = typer.Option(False, "--no-auth", help="Skip saved auth headers for this call."),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Skip the local response cache and fetch a fresh copy."),
 ) -> None:
     resolved_base = get_base_url(base)
-    url, data = fetch(path_or_url, resolved_base, {}, {}, no_auth=no_auth)
+    # Plone batches listings and @search results, so ask for just the rows we will show
+    # (unless the URL already picks a batch size, or --raw needs the full response)
+    params = {"b_size": str(limit)} if limit > 0 and not raw and "b_size=" not in path_or_url else {}
+    url, data = fetch(path_or_url, resolved_base, {}, params, no_auth=no_auth, cache=not no_cache)
     items = data.get("items")
     if not isinstance(items, list):
         raise CliError("Response does not contain an 'items' array.")
@@ -255,28 +404,22 @@ def cmd_items(
     if raw:
         dump_raw(data)
         return
-    if limit:
-        items = items[:limit]
-    print_items(items)
+    print_items(islice(items, limit) if limit else items, plain)
 
 
 @APP.command("components")
 def cmd_components(
     base: Optional[str] = typer.Option(None, "--base", help="Override the API base URL (defaults to saved config or example site)."),
     no_auth: bool = typer.Option(False, "--no-auth", help="Skip saved auth headers for this call."),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Skip the local response cache and fetch a fresh copy."),
 ) -> None:
     resolved_base = get_base_url(base)
-    url, data = fetch(None, resolved_base, {}, {}, no_auth=no_auth)
+    url, data = fetch(None, resolved_base, {}, {}, no_auth=no_auth, cache=not no_cache)
     components = data.get("@components")
     if not isinstance(components, dict):
         raise CliError("Root response is missing '@components'.")
-    table = Table(title="Available components", box=box.MINIMAL)
-    table.add_column("Name", style="bold")
-    table.add_column("Endpoint")
-    for name, meta in components.items():
-        table.add_row(name, meta.get("@id", "—"))
     CONSOLE.print(f"[green]GET[/green] {url}")
-    CONSOLE.print(table)
+    print_components(components)
 
 @APP.command("login")
 def cmd_login(
@@ -306,6 +449,80 @@ def cmd_login(
         raise CliError(str(e)) from e
 
 
+_REPL_HELP_LINES = (
+    "\n[bold]Navigation:[/bold]",
+    "  [cyan]ls [--plain][/cyan]    - List items in current directory (--plain: tab-separated lines)",
+    "  [cyan]next[/cyan] / [cyan]prev[/cyan]     - Show the next / previous batch of ls results",
+    "  [cyan]cd <path>[/cyan]        - Change directory (use '..' to go up)",
+    "  [cyan]pwd[/cyan]              - Show current path",
+    "\n[bold]Content:[/bold]",
+    "  [cyan]get [path...][/cyan]    - Fetch and display content (several paths are fetched concurrently)",
+    "  [cyan]items [path][/cyan]     - List items array",
+    "  [cyan]raw [path][/cyan]      - Show raw JSON",
+    "  [cyan]search <type> [--path <path>][/cyan] - Search for items by object type",
+    "    Example: search Document (finds all Document items)",
+    "    Example: search Folder --path /some/path (finds Folders in specific path)",
+    "\n[bold]Blocks (Plone 6):[/bold]",
+    "  [cyan]blocks [path][/cyan]        - List all blocks in an item",
+    "  [cyan]show-block <id|partial> [path][/cyan] - Show details of a specific block",
+    "  [cyan]delete-block <id|partial> [path][/cyan] - Delete a block from an item",
+    "  [cyan]move-block <id|partial> <up|down|to <pos>> [path][/cyan] - Move a block",
+    "    Examples: move-block abc123 up",
+    "              move-block abc up my-item (partial ID with path)",
+    "              move-block abc123 down",
+    "              move-block abc123 to 0 (move to first position)",
+    "              move-block abc to 0 my-item (partial ID, position, path)",
+    "\n[bold]Tags:[/bold]",
+    "  [cyan]tags [path] [--refresh][/cyan] - List all tags with frequency (--refresh skips the cached counts)",
+    "  [cyan]similar-tags [tag] [threshold][/cyan] - Find similar tags",
+    "    Examples: 'similar-tags mytag 80' or 'similar-tags -t 80' or 'similar-tags mytag --threshold 80'",
+    "  [cyan]merge-tags <source>... <target>[/cyan] - Merge one or more source tags into target tag",
+    "    Example: merge-tags 'swimming' 'swim' (single tag)",
+    "    Example: merge-tags 'swimming' 'diving' 'water-sports' (multiple tags)",
+    "  [cyan]rename-tag <old_name> <new_name>[/cyan] - Rename a tag",
+    "  [cyan]remove-tag <tag>[/cyan] - Remove a tag from all items",
+    "\n[bold]File Operations:[/bold]",
+    "  [cyan]rename <new_title> [path][/cyan] - Rename item title",
+    "  [cyan]set-id <new_id> [path][/cyan] - Change item id (shortname/objectname)",
+    "  [cyan]mv <source> <dest>[/cyan] - Move item to new location (optionally rename)",
+    "    Examples: rename 'New Title'",
+    "              rename 'New Title' my-item",
+    "              set-id new-id",
+    "              set-id new-id my-item",
+    "              mv my-item new-folder",
+    "              mv my-item new-folder/new-name (move and rename)",
+    "  [cyan]cp <source> <dest>[/cyan] - Copy item",
+    "\n[bold]Workflow:[/bold]",
+    "  [cyan]transitions[/cyan]     - List available workflow transitions",
+    "  [cyan]transition <name>[/cyan] - Execute a workflow transition",
+    "  [cyan]bulk-transition <name>[/cyan] - Execute transition on all items in current directory",
+    "\n[bold]Other:[/bold]",
+    "  [cyan]components[/cyan]      - List available components",
+    "  [cyan]connect <site>[/cyan]  - Change base URL (accepts bare host, adds scheme/++api++ automatically)",
+    "  [cyan]login [username] [password][/cyan] - Authenticate and save token (password optional; will prompt if omitted)",
+    "  [cyan]logout[/cyan]          - Remove saved credentials (same as CLI command)",
+    "  [cyan]help[/cyan]            - Show this help",
+    "  [cyan]exit[/cyan] / [cyan]quit[/cyan] - Leave shell (does not log out)\n",
+)
+
+
+def _starting_with(candidates: List[str], prefix: str) -> Iterator[str]:
+    """Yield the candidates that start with prefix; candidates must be sorted."""
+    # Matches form one contiguous run in sorted order, starting where prefix would be inserted
+    for index in range(bisect_left(candidates, prefix), len(candidates)):
+        candidate = candidates[index]
+        if not candidate.startswith(prefix):
+            break
+        yield candidate
+
+
+@lru_cache(maxsize=None)
+def _repl_help() -> Text:
+    """The REPL help text, marked up and highlighted once on first use."""
+    # Lines are rendered one by one so a stray "[...]" can't carry its style into the next line
+    return Text("\n").join(CONSOLE.render_str(line) for line in _REPL_HELP_LINES)
+
+
 @APP.command("repl")
 def cmd_repl(
     base: Optional[str] = typer.Option(None, "--base", help="Override the API base URL (defaults to saved config or demo site)."),
@@ -314,8 +531,24 @@ def cmd_repl(
     """Launch interactive shell with filesystem-like navigation."""
     if not sys.stdin.isatty() or not sys.stdout.isatty():
         raise CliError("The REPL requires an interactive terminal. Run this command directly in a shell.")
+    # prompt_toolkit is only needed here, so one-shot commands don't pay for importing it
+    from prompt_toolkit import prompt
+    from prompt_toolkit.completion import Completer, Completion
+    from prompt_toolkit.history import FileHistory
+    
     resolved_base = get_base_url(base)
+    # resolved_base without its trailing slash, for turning @id URLs into paths
+    base_prefix = resolved_base.rstrip("/")
     current_path = ""
+    # Folder, offset and whether there is a further batch for the last ls/next/prev
+    ls_path, ls_start, ls_has_next = "", 0, False
+    # Whether the last ls asked for tab-separated lines (next/prev keep the same format)
+    ls_plain = False
+    # (time.monotonic(), path, data) of the first ls batch cd fetched, for the next ls to reuse
+    cd_listing: Optional[Tuple[float, str, Dict[str, Any]]] = None
+    
+    def ls_params(start: int) -> Dict[str, Any]:
+        return {"b_start": str(start), "b_size": str(LS_PAGE_SIZE), "metadata_fields": LS_FIELDS}
     
     # Helper function for confirmations that respects -y flag
     def confirm_prompt(message: str) -> bool:
@@ -324,19 +557,116 @@ def cmd_repl(
             return True
         return typer.confirm(message, default=True)
     
+    class BufferedFileHistory(FileHistory):
+        """FileHistory that appends new entries from a background thread.
+        
+        Entered commands are queued and written in one batch about once a second
+        (and at exit), so a slow home directory never delays the next prompt.
+        """
+        FLUSH_INTERVAL = 1.0
+        
+        def __init__(self, filename: str) -> None:
+            super().__init__(filename)
+            self._pending: List[str] = []
+            self._lock = threading.Lock()
+            threading.Thread(target=self._flush_periodically, name="ploneapi-history", daemon=True).start()
+            atexit.register(self.flush)
+        
+        def store_string(self, string: str) -> None:
+            # Same on-disk format as FileHistory.store_string
+            entry = f"\n# {datetime.now()}\n" + "".join(f"+{line}\n" for line in string.split("\n"))
+            with self._lock:
+                self._pending.append(entry)
+        
+        def flush(self) -> None:
+            # Write while holding the lock so entries reach the file in order
+            with self._lock:
+                if not self._pending:
+                    return
+                try:
+                    with open(self.filename, "ab") as handle:
+                        handle.write("".join(self._pending).encode("utf-8"))
+                except OSError:
+                    pass  # Losing history must never break the shell
+                self._pending.clear()
+        
+        def _flush_periodically(self) -> None:
+            while True:
+                time.sleep(self.FLUSH_INTERVAL)
+                self.flush()
+    
     # Load history - ensure directory exists
     history = None
     try:
-        HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
-        history = FileHistory(str(HISTORY_FILE))
+        history_file = _history_file()
+        history_file.parent.mkdir(parents=True, exist_ok=True)
+        history = BufferedFileHistory(str(history_file))
     except Exception:
         history = None
     
-    COMMANDS = ["ls", "cd", "pwd", "get", "items", "raw", "components", "tags", "similar-tags", "merge-tags", "rename-tag", "remove-tag", "search", "blocks", "show-block", "delete-block", "move-block", "move-block-up", "rename", "set-id", "mv", "cp", "connect", "login", "logout", "help", "exit", "quit"]
+    COMMANDS = ["ls", "next", "prev", "cd", "pwd", "get", "items", "raw", "components", "tags", "similar-tags", "merge-tags", "rename-tag", "remove-tag", "search", "blocks", "show-block", "delete-block", "move-block", "move-block-up", "rename", "set-id", "mv", "cp", "connect", "login", "logout", "help", "exit", "quit"]
+    sorted_commands = sorted(COMMANDS)  # for prefix matching; COMMANDS keeps the display order
 
     class ReplCompleter(Completer):
         _tag_cache: Optional[List[str]] = None
         _tag_cache_path: str = ""
+        _ITEM_CACHE_TTL = 5.0  # seconds a folder's item names are reused between Tab presses
+        
+        def __init__(self) -> None:
+            # (base, path) -> (time.monotonic() when fetched, item names)
+            self._item_cache: Dict[Tuple[str, str], Tuple[float, List[str]]] = {}
+            # Caps concurrent background prefetches; their threads are daemons so exit never waits on them
+            self._prefetch_slots = threading.BoundedSemaphore(4)
+        
+        def invalidate_items(self) -> None:
+            """Forget cached item names, e.g. after an item was moved or renamed."""
+            self._item_cache.clear()
+        
+        def _item_names(self, items: List[Dict[str, Any]]) -> List[str]:
+            """Sorted names to complete for a folder's items, without duplicates."""
+            names = set()
+            for item in items:
+                # Prefer the 'id' field (usually just the name like "images")
+                item_name = item.get("id")
+                if item_name:
+                    names.add(item_name)
+                    continue
+                
+                # Fallback: extract from @id URL
+                item_id = item.get("@id", "")
+                if item_id:
+                    # Remove base URL to get relative path
+                    if item_id.startswith(base_prefix):
+                        rel = _rel_path(item_id, base_prefix)
+                    else:
+                        # Parse URL to get just the last segment
+                        parsed = urlparse(item_id)
+                        path_parts = parsed.path.rstrip("/").split("/")
+                        rel = path_parts[-1] if path_parts else ""
+                        
+                    if rel:
+                        names.add(rel)
+            return sorted(names)
+        
+        def prime(self, path: str, items: Any) -> None:
+            """Cache the item names of a folder the REPL has just fetched anyway."""
+            if isinstance(items, list):
+                self._item_cache[(resolved_base, path)] = (time.monotonic(), self._item_names(items))
+        
+        def prefetch(self, paths: List[str]) -> None:
+            """Fetch completion names for these folders in the background."""
+            now = time.monotonic()
+            for path in paths:
+                cached = self._item_cache.get((resolved_base, path))
+                if cached is None or now - cached[0] >= self._ITEM_CACHE_TTL:
+                    threading.Thread(
+                        target=self._prefetch_one, args=(path,), name="ploneapi-prefetch", daemon=True
+                    ).start()
+        
+        def _prefetch_one(self, path: str) -> None:
+            with self._prefetch_slots:
+                # A leading "/" makes _item_suggestions treat the path as absolute
+                self._item_suggestions("/" + path)
         
         def _item_suggestions(self, path_prefix: str = "") -> List[str]:
             """Get item suggestions from a specific path.
@@ -364,32 +694,17 @@ def cmd_repl(
                 else:
                     fetch_path = current_path
                 
-                _, data = fetch(fetch_path, resolved_base, {}, {}, no_auth=False)
-                items = data.get("items", [])
-                for item in items:
-                    # Prefer the 'id' field (usually just the name like "images")
-                    item_name = item.get("id")
-                    if item_name:
-                        if item_name not in results:
-                            results.append(item_name)
-                        continue
-                    
-                    # Fallback: extract from @id URL
-                    item_id = item.get("@id", "")
-                    if item_id:
-                        # Remove base URL to get relative path
-                        if resolved_base in item_id:
-                            rel = item_id.replace(resolved_base, "").lstrip("/")
-                        else:
-                            # Parse URL to get just the last segment
-                            from urllib.parse import urlparse
-                            parsed = urlparse(item_id)
-                            path_parts = parsed.path.rstrip("/").split("/")
-                            rel = path_parts[-1] if path_parts else ""
-                        
-                        if rel and rel not in results:
-                            results.append(rel)
-            except Exception:
+                cache_key = (resolved_base, fetch_path)
+                cached = self._item_cache.get(cache_key)
+                if cached is not None and time.monotonic() - cached[0] < self._ITEM_CACHE_TTL:
+                    return cached[1]
+                
+                # api.fetch rather than the CLI wrapper: a CliError prints as soon as it is
+                # raised, which would land in the middle of the prompt
+                _, data = api.fetch(fetch_path, resolved_base, {}, {"metadata_fields": LS_FIELDS}, no_auth=False)
+                results = self._item_names(data.get("items", []))
+                self._item_cache[cache_key] = (time.monotonic(), results)
+            except (api.APIError, AttributeError):
                 pass
             return results
         
@@ -424,9 +739,8 @@ def cmd_repl(
 
             if len(parts) == 1 and not has_trailing_space:
                 prefix = parts[0]
-                for cmd in COMMANDS:
-                    if cmd.startswith(prefix):
-                        yield Completion(cmd, start_position=-len(prefix))
+                for cmd in _starting_with(sorted_commands, prefix):
+                    yield Completion(cmd, start_position=-len(prefix))
                 return
 
             cmd = parts[0]
@@ -459,11 +773,10 @@ def cmd_repl(
                                     dir_path, prefix = path_parts
                                     suggestions = self._item_suggestions(dir_path)
                                     # Only suggest items that start with the prefix
-                                    for suggestion in suggestions:
-                                        if suggestion.startswith(prefix):
-                                            # Return the full path including the directory
-                                            full_suggestion = f"{dir_path}/{suggestion}"
-                                            yield Completion(full_suggestion, start_position=-len(path_text))
+                                    for suggestion in _starting_with(suggestions, prefix):
+                                        # Return the full path including the directory
+                                        full_suggestion = f"{dir_path}/{suggestion}"
+                                        yield Completion(full_suggestion, start_position=-len(path_text))
                                 else:
                                     # Just a trailing slash, suggest from the directory
                                     dir_path = path_text.rstrip("/")
@@ -475,9 +788,8 @@ def cmd_repl(
                                 # Simple case: no slashes, just suggest from current directory
                                 suggestions = self._item_suggestions()
                                 prefix = path_text if not has_trailing_space else ""
-                                for suggestion in suggestions:
-                                    if suggestion.startswith(prefix):
-                                        yield Completion(suggestion, start_position=-len(path_text))
+                                for suggestion in _starting_with(suggestions, prefix):
+                                    yield Completion(suggestion, start_position=-len(path_text))
                 elif len(parts) == required_args_before_path:
                     # All required args provided, suggest paths from current directory
                     suggestions = self._item_suggestions()
@@ -505,11 +817,10 @@ def cmd_repl(
                                 dir_path, prefix = path_parts
                                 suggestions = self._item_suggestions(dir_path)
                                 # Only suggest items that start with the prefix
-                                for suggestion in suggestions:
-                                    if suggestion.startswith(prefix):
-                                        # Return the full path including the directory
-                                        full_suggestion = f"{dir_path}/{suggestion}"
-                                        yield Completion(full_suggestion, start_position=-len(path_text))
+                                for suggestion in _starting_with(suggestions, prefix):
+                                    # Return the full path including the directory
+                                    full_suggestion = f"{dir_path}/{suggestion}"
+                                    yield Completion(full_suggestion, start_position=-len(path_text))
                             else:
                                 # Just a trailing slash, suggest from the directory
                                 dir_path = path_text.rstrip("/")
@@ -521,9 +832,8 @@ def cmd_repl(
                             # Simple case: no slashes, just suggest from current directory
                             suggestions = self._item_suggestions()
                             prefix = path_text if not has_trailing_space else ""
-                            for suggestion in suggestions:
-                                if suggestion.startswith(prefix):
-                                    yield Completion(suggestion, start_position=-len(path_text))
+                            for suggestion in _starting_with(suggestions, prefix):
+                                yield Completion(suggestion, start_position=-len(path_text))
                 else:
                     # No argument yet, suggest from current directory
                     suggestions = self._item_suggestions()
@@ -605,16 +915,14 @@ def cmd_repl(
                                         if len(path_parts) == 2:
                                             dir_path, prefix = path_parts
                                             suggestions = self._item_suggestions(dir_path)
-                                            for suggestion in suggestions:
-                                                if suggestion.startswith(prefix):
-                                                    full_suggestion = f"{dir_path}/{suggestion}"
-                                                    yield Completion(full_suggestion, start_position=-len(dest_text))
+                                            for suggestion in _starting_with(suggestions, prefix):
+                                                full_suggestion = f"{dir_path}/{suggestion}"
+                                                yield Completion(full_suggestion, start_position=-len(dest_text))
                                     else:
                                         suggestions = self._item_suggestions()
                                         prefix = dest_text if not has_trailing_space else ""
-                                        for suggestion in suggestions:
-                                            if suggestion.startswith(prefix):
-                                                yield Completion(suggestion, start_position=-len(dest_text))
+                                        for suggestion in _starting_with(suggestions, prefix):
+                                            yield Completion(suggestion, start_position=-len(dest_text))
             
             # Tag suggestions for tag management commands
             elif cmd in ("merge-tags", "rename-tag", "remove-tag", "similar-tags"):
@@ -628,28 +936,196 @@ def cmd_repl(
                     if len(parts) > 1:
                         suggestions = self._tag_suggestions()
                         prefix = last_word if not has_trailing_space else ""
-                        for suggestion in suggestions:
-                            if suggestion.startswith(prefix) and suggestion not in parts[1:]:
+                        for suggestion in _starting_with(suggestions, prefix):
+                            if suggestion not in parts[1:]:
                                 yield Completion(suggestion, start_position=-len(prefix))
                 elif cmd in ("rename-tag", "remove-tag"):
                     # First argument is a tag
                     if len(parts) == 2 and not has_trailing_space:
                         suggestions = self._tag_suggestions()
                         prefix = last_word
-                        for suggestion in suggestions:
-                            if suggestion.startswith(prefix):
-                                yield Completion(suggestion, start_position=-len(prefix))
+                        for suggestion in _starting_with(suggestions, prefix):
+                            yield Completion(suggestion, start_position=-len(prefix))
                 elif cmd == "similar-tags":
                     # First argument (if present) is a tag
                     if len(parts) == 2 and not has_trailing_space:
                         suggestions = self._tag_suggestions()
                         prefix = last_word
-                        for suggestion in suggestions:
-                            if suggestion.startswith(prefix):
-                                yield Completion(suggestion, start_position=-len(prefix))
+                        for suggestion in _starting_with(suggestions, prefix):
+                            yield Completion(suggestion, start_position=-len(prefix))
     
     completer = ReplCompleter()
     
+    # Navigation and read-only commands, dispatched by name from the loop below
+    def do_pwd(cmd: str, args: List[str]) -> None:
+        path_display = current_path if current_path else "/"
+        CONSOLE.print(f"[cyan]{path_display}[/cyan]")
+    
+    def do_ls(cmd: str, args: List[str]) -> None:
+        nonlocal ls_path, ls_start, ls_has_next, ls_plain, cd_listing
+        # ls shows the first batch of the current folder; next/prev page through it
+        if cmd == "ls":
+            ls_plain = "--plain" in args
+        if cmd == "ls" or ls_path != current_path:
+            start = 0
+        elif cmd == "next":
+            if not ls_has_next:
+                CONSOLE.print("[yellow]No more items[/yellow]")
+                return
+            start = ls_start + LS_PAGE_SIZE
+        else:
+            if ls_start == 0:
+                CONSOLE.print("[yellow]Already at the first page[/yellow]")
+                return
+            start = max(ls_start - LS_PAGE_SIZE, 0)
+        try:
+            listing, cd_listing = cd_listing, None
+            if (
+                start == 0
+                and listing is not None
+                and listing[1] == current_path
+                and time.monotonic() - listing[0] < LS_REUSE_TTL
+            ):
+                # cd just fetched this batch
+                data = listing[2]
+            else:
+                _, data = fetch(current_path, resolved_base, {}, ls_params(start), no_auth=False)
+            ls_path, ls_start = current_path, start
+            ls_has_next = bool((data.get("batching") or {}).get("next"))
+            items = data.get("items", [])
+            if start == 0:
+                completer.prime(current_path, items)
+                # Warm completion for the first few subfolders while the listing is being read
+                completer.prefetch([
+                    posixpath.join(current_path, item["id"])
+                    for item in items
+                    if item.get("id") and api.is_container(item)
+                ][:LS_PREFETCH_FOLDERS])
+            if items:
+                print_items_with_metadata(items, ls_plain)
+                if ls_has_next or start:
+                    total = data.get("items_total", "?")
+                    hint = "Type 'next' for more" if ls_has_next else "Type 'prev' to go back"
+                    CONSOLE.print(f"[dim]Items {start + 1}–{start + len(items)} of {total}. {hint}.[/dim]")
+            else:
+                CONSOLE.print("[dim]No items[/dim]")
+        except CliError as e:
+            CONSOLE.print(f"[red]Error:[/red] {e}")
+        except Exception as e:
+            CONSOLE.print(f"[red]Error:[/red] {e}")
+    
+    def do_cd(cmd: str, args: List[str]) -> None:
+        nonlocal current_path, cd_listing
+        if not args:
+            current_path = ""
+            CONSOLE.print("[green]Changed to root[/green]")
+        elif args[0] == "..":
+            # Go up one level
+            if current_path:
+                current_path = posixpath.dirname(current_path.rstrip("/"))
+            else:
+                CONSOLE.print("[yellow]Already at root[/yellow]")
+        else:
+            target = args[0]
+            # Handle full URLs
+            if target.startswith(("http://", "https://")):
+                # Remove the base URL portion to get relative path
+                if target.startswith(base_prefix):
+                    target = _rel_path(target, base_prefix)
+                else:
+                    # If it's a different domain, extract just the path
+                    target = urlparse(target).path.lstrip("/")
+                    # Remove ++api++ if present
+                    if target.startswith("++api++/"):
+                        target = target[8:]
+            
+            target = target.lstrip("/")
+            # Try to navigate to the item
+            try:
+                # Resolve against the current folder, so "../other" and "a/../b" work too
+                test_path = posixpath.normpath(posixpath.join("/" + current_path, target)).strip("/")
+                # Fetch the first ls batch, so a following ls can show it without another request
+                _, data = fetch(test_path, resolved_base, {}, ls_params(0), no_auth=False)
+                current_path = test_path
+                cd_listing = (time.monotonic(), test_path, data)
+                completer.prime(current_path, data.get("items"))
+                title = data.get("title", data.get("id", test_path))
+                CONSOLE.print(f"[green]Changed to:[/green] {title}")
+            except Exception as e:
+                CONSOLE.print(f"[red]Error:[/red] Cannot navigate to '{args[0]}': {e}")
+    
+    def do_get(cmd: str, args: List[str]) -> None:
+        if len(args) > 1:
+            # Several paths: fetch them concurrently, then show each in the order given
+            results, errors = api.fetch_many(resolved_base, args)
+            for path in args:
+                if path in errors:
+                    CONSOLE.print(f"[red]Error:[/red] {errors[path]}")
+                    continue
+                data = results[path]
+                CONSOLE.print(f"[green]GET[/green] {api.resolve_url(path, resolved_base)}")
+                print_summary(data)
+                items = data.get("items") or data.get("results")
+                if isinstance(items, list) and items:
+                    print_items(items[:10])  # Limit to 10 for display
+            return
+        path = args[0] if args else current_path
+        try:
+            url, data = fetch(path, resolved_base, {}, {}, no_auth=False)
+            CONSOLE.print(f"[green]GET[/green] {url}")
+            print_summary(data)
+            items = data.get("items") or data.get("results")
+            if isinstance(items, list) and items:
+                print_items(items[:10])  # Limit to 10 for display
+        except Exception as e:
+            CONSOLE.print(f"[red]Error:[/red] {e}")
+    
+    def do_items(cmd: str, args: List[str]) -> None:
+        path = args[0] if args else current_path
+        try:
+            url, data = fetch(path, resolved_base, {}, {}, no_auth=False)
+            items = data.get("items")
+            if not isinstance(items, list):
+                CONSOLE.print("[red]Error:[/red] Response does not contain an 'items' array.")
+            else:
+                CONSOLE.print(f"[green]GET[/green] {url}")
+                print_items(items)
+        except Exception as e:
+            CONSOLE.print(f"[red]Error:[/red] {e}")
+    
+    def do_raw(cmd: str, args: List[str]) -> None:
+        path = args[0] if args else current_path
+        try:
+            url, data = fetch(path, resolved_base, {}, {}, no_auth=False)
+            CONSOLE.print(f"[green]GET[/green] {url}")
+            dump_raw(data)
+        except Exception as e:
+            CONSOLE.print(f"[red]Error:[/red] {e}")
+    
+    def do_components(cmd: str, args: List[str]) -> None:
+        try:
+            url, data = fetch(None, resolved_base, {}, {}, no_auth=False)
+            components = data.get("@components")
+            if not isinstance(components, dict):
+                CONSOLE.print("[red]Error:[/red] Root response is missing '@components'.")
+            else:
+                CONSOLE.print(f"[green]GET[/green] {url}")
+                print_components(components)
+        except Exception as e:
+            CONSOLE.print(f"[red]Error:[/red] {e}")
+    
+    handlers: Dict[str, Callable[[str, List[str]], None]] = {
+        "pwd": do_pwd,
+        "ls": do_ls,
+        "next": do_ls,
+        "prev": do_ls,
+        "cd": do_cd,
+        "get": do_get,
+        "items": do_items,
+        "raw": do_raw,
+        "components": do_components,
+    }
+    
     CONSOLE.print("[bold green]Plone API Shell[/bold green]")
     CONSOLE.print(f"Base URL: [cyan]{resolved_base}[/cyan]")
     CONSOLE.print("Type 'help' for commands. Use 'exit' to leave the shell, 'login' to authenticate, or 'logout' to remove saved credentials.\n")
@@ -667,7 +1143,16 @@ def cmd_repl(
             if not text.strip():
                 continue
             
-            parts = shlex.split(text)
+            if "'" in text or '"' in text or "\\" in text:
+                try:
+                    parts = shlex.split(text)
+                except ValueError as e:
+                    # e.g. an unclosed quote
+                    CONSOLE.print(f"[red]Error:[/red] {e}")
+                    continue
+            else:
+                # Nothing for shlex to unquote or escape, so a plain split gives the same result
+                parts = text.split()
             if not parts:
                 continue
             
@@ -677,162 +1162,15 @@ def cmd_repl(
             if cmd == "exit" or cmd == "quit":
                 break
             elif cmd == "help":
-                CONSOLE.print("\n[bold]Navigation:[/bold]")
-                CONSOLE.print("  [cyan]ls[/cyan]              - List items in current directory")
-                CONSOLE.print("  [cyan]cd <path>[/cyan]        - Change directory (use '..' to go up)")
-                CONSOLE.print("  [cyan]pwd[/cyan]              - Show current path")
-                CONSOLE.print("\n[bold]Content:[/bold]")
-                CONSOLE.print("  [cyan]get [path][/cyan]       - Fetch and display content")
-                CONSOLE.print("  [cyan]items [path][/cyan]     - List items array")
-                CONSOLE.print("  [cyan]raw [path][/cyan]      - Show raw JSON")
-                CONSOLE.print("  [cyan]search <type> [--path <path>][/cyan] - Search for items by object type")
-                CONSOLE.print("    Example: search Document (finds all Document items)")
-                CONSOLE.print("    Example: search Folder --path /some/path (finds Folders in specific path)")
-                CONSOLE.print("\n[bold]Blocks (Plone 6):[/bold]")
-                CONSOLE.print("  [cyan]blocks [path][/cyan]        - List all blocks in an item")
-                CONSOLE.print("  [cyan]show-block <id|partial> [path][/cyan] - Show details of a specific block")
-                CONSOLE.print("  [cyan]delete-block <id|partial> [path][/cyan] - Delete a block from an item")
-                CONSOLE.print("  [cyan]move-block <id|partial> <up|down|to <pos>> [path][/cyan] - Move a block")
-                CONSOLE.print("    Examples: move-block abc123 up")
-                CONSOLE.print("              move-block abc up my-item (partial ID with path)")
-                CONSOLE.print("              move-block abc123 down")
-                CONSOLE.print("              move-block abc123 to 0 (move to first position)")
-                CONSOLE.print("              move-block abc to 0 my-item (partial ID, position, path)")
-                CONSOLE.print("\n[bold]Tags:[/bold]")
-                CONSOLE.print("  [cyan]tags [path][/cyan]     - List all tags with frequency")
-                CONSOLE.print("  [cyan]similar-tags [tag] [threshold][/cyan] - Find similar tags")
-                CONSOLE.print("    Examples: 'similar-tags mytag 80' or 'similar-tags -t 80' or 'similar-tags mytag --threshold 80'")
-                CONSOLE.print("  [cyan]merge-tags <source>... <target>[/cyan] - Merge one or more source tags into target tag")
-                CONSOLE.print("    Example: merge-tags 'swimming' 'swim' (single tag)")
-                CONSOLE.print("    Example: merge-tags 'swimming' 'diving' 'water-sports' (multiple tags)")
-                CONSOLE.print("  [cyan]rename-tag <old_name> <new_name>[/cyan] - Rename a tag")
-                CONSOLE.print("  [cyan]remove-tag <tag>[/cyan] - Remove a tag from all items")
-                CONSOLE.print("\n[bold]File Operations:[/bold]")
-                CONSOLE.print("  [cyan]rename <new_title> [path][/cyan] - Rename item title")
-                CONSOLE.print("  [cyan]set-id <new_id> [path][/cyan] - Change item id (shortname/objectname)")
-                CONSOLE.print("  [cyan]mv <source> <dest>[/cyan] - Move item to new location (optionally rename)")
-                CONSOLE.print("    Examples: rename 'New Title'")
-                CONSOLE.print("              rename 'New Title' my-item")
-                CONSOLE.print("              set-id new-id")
-                CONSOLE.print("              set-id new-id my-item")
-                CONSOLE.print("              mv my-item new-folder")
-                CONSOLE.print("              mv my-item new-folder/new-name (move and rename)")
-                CONSOLE.print("  [cyan]cp <source> <dest>[/cyan] - Copy item")
-                CONSOLE.print("\n[bold]Workflow:[/bold]")
-                CONSOLE.print("  [cyan]transitions[/cyan]     - List available workflow transitions")
-                CONSOLE.print("  [cyan]transition <name>[/cyan] - Execute a workflow transition")
-                CONSOLE.print("  [cyan]bulk-transition <name>[/cyan] - Execute transition on all items in current directory")
-                CONSOLE.print("\n[bold]Other:[/bold]")
-                CONSOLE.print("  [cyan]components[/cyan]      - List available components")
-                CONSOLE.print("  [cyan]connect <site>[/cyan]  - Change base URL (accepts bare host, adds scheme/++api++ automatically)")
-                CONSOLE.print("  [cyan]login [username] [password][/cyan] - Authenticate and save token (password optional; will prompt if omitted)")
-                CONSOLE.print("  [cyan]logout[/cyan]          - Remove saved credentials (same as CLI command)")
-                CONSOLE.print("  [cyan]help[/cyan]            - Show this help")
-                CONSOLE.print("  [cyan]exit[/cyan] / [cyan]quit[/cyan] - Leave shell (does not log out)\n")
-            elif cmd == "pwd":
-                path_display = current_path if current_path else "/"
-                CONSOLE.print(f"[cyan]{path_display}[/cyan]")
-            elif cmd == "ls":
-                try:
-                    _, data = fetch(current_path, resolved_base, {}, {}, no_auth=False)
-                    items = data.get("items", [])
-                    if items:
-                        print_items_with_metadata(items)
-                    else:
-                        CONSOLE.print("[dim]No items[/dim]")
-                except CliError as e:
-                    CONSOLE.print(f"[red]Error:[/red] {e}")
-                except Exception as e:
-                    CONSOLE.print(f"[red]Error:[/red] {e}")
-            elif cmd == "cd":
-                if not args:
-                    current_path = ""
-                    CONSOLE.print("[green]Changed to root[/green]")
-                elif args[0] == "..":
-                    # Go up one level
-                    if current_path:
-                        parts_path = current_path.rstrip("/").split("/")
-                        if len(parts_path) > 1:
-                            current_path = "/".join(parts_path[:-1])
-                        else:
-                            current_path = ""
-                    else:
-                        CONSOLE.print("[yellow]Already at root[/yellow]")
-                else:
-                    target = args[0]
-                    # Handle full URLs
-                    if target.startswith(("http://", "https://")):
-                        # Extract path from full URL
-                        from urllib.parse import urlparse
-                        parsed = urlparse(target)
-                        # Remove the base URL portion to get relative path
-                        if resolved_base.rstrip("/") in target:
-                            target = target.replace(resolved_base.rstrip("/"), "").lstrip("/")
-                        else:
-                            # If it's a different domain, extract just the path
-                            target = parsed.path.lstrip("/")
-                            # Remove ++api++ if present
-                            if target.startswith("++api++/"):
-                                target = target[8:]
-                    
-                    target = target.lstrip("/")
-                    # Try to navigate to the item
-                    try:
-                        test_path = f"{current_path}/{target}".strip("/") if current_path else target
-                        _, data = fetch(test_path, resolved_base, {}, {}, no_auth=False)
-                        current_path = test_path
-                        title = data.get("title", data.get("id", test_path))
-                        CONSOLE.print(f"[green]Changed to:[/green] {title}")
-                    except Exception as e:
-                        CONSOLE.print(f"[red]Error:[/red] Cannot navigate to '{args[0]}': {e}")
-            elif cmd == "get":
-                path = args[0] if args else current_path
-                try:
-                    url, data = fetch(path, resolved_base, {}, {}, no_auth=False)
-                    CONSOLE.print(f"[green]GET[/green] {url}")
-                    print_summary(data)
-                    items = data.get("items") or data.get("results")
-                    if isinstance(items, list) and items:
-                        print_items(items[:10])  # Limit to 10 for display
-                except Exception as e:
-                    CONSOLE.print(f"[red]Error:[/red] {e}")
-            elif cmd == "items":
-                path = args[0] if args else current_path
-                try:
-                    url, data = fetch(path, resolved_base, {}, {}, no_auth=False)
-                    items = data.get("items")
-                    if not isinstance(items, list):
-                        CONSOLE.print("[red]Error:[/red] Response does not contain an 'items' array.")
-                    else:
-                        CONSOLE.print(f"[green]GET[/green] {url}")
-                        print_items(items)
-                except Exception as e:
-                    CONSOLE.print(f"[red]Error:[/red] {e}")
-            elif cmd == "raw":
-                path = args[0] if args else current_path
-                try:
-                    url, data = fetch(path, resolved_base, {}, {}, no_auth=False)
-                    CONSOLE.print(f"[green]GET[/green] {url}")
-                    dump_raw(data)
-                except Exception as e:
-                    CONSOLE.print(f"[red]Error:[/red] {e}")
-            elif cmd == "components":
-                try:
-                    url, data = fetch(None, resolved_base, {}, {}, no_auth=False)
-                    components = data.get("@components")
-                    if not isinstance(components, dict):
-                        CONSOLE.print("[red]Error:[/red] Root response is missing '@components'.")
-                    else:
-                        table = Table(title="Available components", box=box.MINIMAL)
-                        table.add_column("Name", style="bold")
-                        table.add_column("Endpoint")
-                        for name, meta in components.items():
-                            table.add_row(name, meta.get("@id", "—"))
-                        CONSOLE.print(f"[green]GET[/green] {url}")
-                        CONSOLE.print(table)
-                except Exception as e:
-                    CONSOLE.print(f"[red]Error:[/red] {e}")
+                CONSOLE.print(_repl_help())
+            elif cmd in handlers:
+                handlers[cmd](cmd, args)
             elif cmd == "tags":
+                # Tag counts are reused for a minute; --refresh collects them again
+                if "--refresh" in args:
+                    args = [arg for arg in args if arg != "--refresh"]
+                    api.invalidate_tag_cache()
+                    completer._tag_cache = None
                 path = args[0] if args else current_path
                 try:
                     def warn_print(msg: str) -> None:
@@ -995,20 +1333,15 @@ def cmd_repl(
                                 confirm_msg = f"Merge {len(source_tags)} tags into '{target_tag}' on {len(items_list)} item(s)?"
                             
                             if confirm_prompt(confirm_msg):
-                                updated = 0
-                                for item in items_list:
-                                    try:
-                                        item_path = item.get("@id", "").replace(resolved_base.rstrip("/"), "").lstrip("/")
-                                        current_tags = item.get("subjects", [])
-                                        # Remove all source tags, add target tag if not present
-                                        new_tags = [tag for tag in current_tags if tag not in source_tags]
-                                        if target_tag not in new_tags:
-                                            new_tags.append(target_tag)
-                                        api.update_item_subjects(resolved_base, item_path, new_tags, no_auth=False)
-                                        updated += 1
-                                    except Exception:
-                                        pass
-                                CONSOLE.print(f"[green]Updated {updated} item(s)[/green]")
+                                drop = frozenset(source_tags)
+                                skipped = api.fill_subjects(resolved_base, items_list)
+                                updates = _subject_updates(
+                                    items_list, base_prefix, lambda tags: _merged_tags(tags, drop, target_tag)
+                                )
+                                results, _ = api.update_items_subjects(resolved_base, updates, no_auth=False)
+                                CONSOLE.print(f"[green]Updated {len(results)} item(s)[/green]")
+                                if skipped:
+                                    CONSOLE.print(f"[yellow]Skipped {len(skipped)} item(s) whose tags could not be read[/yellow]")
                     except Exception as e:
                         CONSOLE.print(f"[red]Error:[/red] {e}")
             elif cmd == "rename-tag":
@@ -1037,7 +1370,6 @@ def cmd_repl(
                                         
                                         # Convert full URL to relative API path
                                         if item_id.startswith(("http://", "https://")):
-                                            from urllib.parse import urlparse
                                             parsed = urlparse(item_id)
                                             path = parsed.path
                                             
@@ -1089,12 +1421,8 @@ def cmd_repl(
                                             # Fallback to subjects from search result
                                             current_tags = item.get("subjects", [])
                                         
-                                        # Replace old tag with new tag (case-sensitive match)
-                                        # Remove all instances of old_tag and add new_tag
-                                        new_tags = [tag for tag in current_tags if tag != old_tag]
-                                        # Add new tag if it's not already present (avoid duplicates)
-                                        if new_tag not in new_tags:
-                                            new_tags.append(new_tag)
+                                        # Replace old tag with new tag (case-sensitive match, no duplicates)
+                                        new_tags = _merged_tags(current_tags, {old_tag}, new_tag)
                                         
                                         # Only update if tags actually changed
                                         if set(current_tags) != set(new_tags):
@@ -1113,7 +1441,6 @@ def cmd_repl(
                                                 continue
                                             
                                             # Small delay to allow server to process the update before verification
-                                            import time
                                             time.sleep(0.1)  # 100ms delay
                                             
                                             # Verify the update succeeded by fetching the item again
@@ -1210,17 +1537,12 @@ def cmd_repl(
                         else:
                             CONSOLE.print(f"[cyan]Found {len(items)} item(s) with tag '{tag}'[/cyan]")
                             if confirm_prompt(f"Remove tag '{tag}' from {len(items)} item(s)?"):
-                                updated = 0
-                                for item in items:
-                                    try:
-                                        item_path = item.get("@id", "").replace(resolved_base.rstrip("/"), "").lstrip("/")
-                                        current_tags = item.get("subjects", [])
-                                        new_tags = [t for t in current_tags if t != tag]
-                                        api.update_item_subjects(resolved_base, item_path, new_tags, no_auth=False)
-                                        updated += 1
-                                    except Exception:
-                                        pass
-                                CONSOLE.print(f"[green]Updated {updated} item(s)[/green]")
+                                skipped = api.fill_subjects(resolved_base, items)
+                                updates = _subject_updates(items, base_prefix, lambda tags: [t for t in tags if t != tag])
+                                results, _ = api.update_items_subjects(resolved_base, updates, no_auth=False)
+                                CONSOLE.print(f"[green]Updated {len(results)} item(s)[/green]")
+                                if skipped:
+                                    CONSOLE.print(f"[yellow]Skipped {len(skipped)} item(s) whose tags could not be read[/yellow]")
                     except Exception as e:
                         CONSOLE.print(f"[red]Error:[/red] {e}")
             elif cmd == "rename":
@@ -1268,6 +1590,8 @@ def cmd_repl(
                             if confirm_prompt(f"Change id from '{current_id}' to '{new_id}'?"):
                                 # Update the id using PATCH
                                 api.patch(path, resolved_base, {"id": new_id}, {}, no_auth=False)
+                                completer.invalidate_items()
+                                cd_listing = None
                                 CONSOLE.print(f"[green]Changed id to '{new_id}'[/green]")
                         except (CliError, api.APIError) as e:
                             error_msg = str(e)
@@ -1326,6 +1650,8 @@ def cmd_repl(
                         if confirm_prompt(move_msg):
                             # Perform the move
                             api.move_item(resolved_base, source_path, dest_folder, new_id, no_auth=False)
+                            completer.invalidate_items()
+                            cd_listing = None
                             result_msg = f"Moved '{source_title}' to '{dest_title}'"
                             if new_id:
                                 result_msg += f" as '{new_id}'"
@@ -1353,7 +1679,7 @@ def cmd_repl(
                     config.pop("auth")
                     CONSOLE.print("[yellow]Cleared saved credentials for the previous site. Run 'login' to authenticate again.[/yellow]")
                 api.save_config(config)
-                resolved_base = persisted_base
+                resolved_base = base_prefix = persisted_base
                 current_path = ""
                 completer._tag_cache = None
                 completer._tag_cache_path = ""
@@ -1371,8 +1697,7 @@ def cmd_repl(
                 except api.APIError as e:
                     CONSOLE.print(f"[red]Login failed:[/red] {e}")
             elif cmd == "logout":
-                if CONFIG_FILE.exists():
-                    delete_config()
+                if delete_config():
                     CONSOLE.print(f"[yellow]Removed saved credentials at {CONFIG_FILE}[/yellow]")
                 else:
                     CONSOLE.print("No saved credentials found.")
@@ -1443,7 +1768,7 @@ def cmd_repl(
                             block_id = matching_blocks[0]
                             block = blocks[block_id]
                             CONSOLE.print(f"[green]Block:[/green] {block_id}")
-                            CONSOLE.print(JSON(json.dumps(block, indent=2)))
+                            dump_raw(block)
                     except Exception as e:
                         CONSOLE.print(f"[red]Error:[/red] {e}")
             elif cmd == "delete-block":
@@ -1674,8 +1999,7 @@ def main(ctx: typer.Context):
 
 @APP.command("logout")
 def cmd_logout() -> None:
-    if CONFIG_FILE.exists():
-        delete_config()
+    if delete_config():
         CONSOLE.print(f"[yellow]Removed saved credentials at {CONFIG_FILE}[/yellow]")
     else:
         CONSOLE.print("No saved credentials found.")
@@ -1709,9 +2033,12 @@ def cmd_tags(
     recursive: bool = typer.Option(False, "--recursive", "-r", help="Include tags from subdirectories."),
     no_auth: bool = typer.Option(False, "--no-auth", help="Skip saved auth headers."),
     debug: bool = typer.Option(False, "--debug", help="Show debug information about tag collection."),
+    refresh: bool = typer.Option(False, "--refresh", help="Collect tags again instead of reusing a recent result."),
 ) -> None:
     """List all tags/subjects with their frequency."""
     resolved_base = get_base_url(base)
+    if refresh:
+        api.invalidate_tag_cache()
     try:
         if debug:
             CONSOLE.print(f"[dim]Debug: Searching for tags in path: '{path or '(root)'}'[/dim]")
@@ -1766,6 +2093,7 @@ def cmd_merge_tags(
     base: Optional[str] = typer.Option(None, "--base", help="Override the API base URL."),
     dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be changed without making changes."),
     no_auth: bool = typer.Option(False, "--no-auth", help="Skip saved auth headers."),
+    jobs: int = typer.Option(api.UPDATE_CONCURRENCY, "--jobs", "-j", min=1, help="Number of items to update at once."),
 ) -> None:
     """
     Merge one or more tags into a target tag.
@@ -1782,6 +2110,9 @@ def cmd_merge_tags(
         CONSOLE.print("[red]Error:[/red] At least one source tag is required")
         raise typer.Exit(1)
     
+    # Membership set for rewriting each item's subjects
+    drop = frozenset(source_tags)
+    
     # Collect all items that have any of the source tags
     all_items: Dict[str, Dict[str, Any]] = {}  # Use @id as key to deduplicate
     source_tag_counts: Dict[str, int] = {}
@@ -1818,10 +2149,7 @@ def cmd_merge_tags(
         for item in items_list[:10]:  # Show first 10
             title = item.get("title", item.get("id", "—"))
             current_tags = item.get("subjects", [])
-            # Remove all source tags, add target tag if not present
-            new_tags = [tag for tag in current_tags if tag not in source_tags]
-            if target_tag not in new_tags:
-                new_tags.append(target_tag)
+            new_tags = _merged_tags(current_tags, drop, target_tag)
             CONSOLE.print(f"  {title}: {current_tags} → {new_tags}")
         if len(items_list) > 10:
             CONSOLE.print(f"  ... and {len(items_list) - 10} more")
@@ -1837,106 +2165,94 @@ def cmd_merge_tags(
     if not typer.confirm(confirm_msg):
         raise typer.Exit(0)
     
-    updated = 0
-    errors = 0
+    base_prefix = resolved_base.rstrip("/")
     
-    for item in items_list:
+    def merge_item(item: Dict[str, Any]) -> Tuple[Optional[bool], List[str]]:
+        """Merge the source tags on one item.
+        
+        Returns True if updated, None if unchanged, False on error, plus the messages to
+        print for the item (printed afterwards, so output from parallel workers stays in order).
+        """
+        title = item.get("title", "unknown")
+        notes: List[str] = []
         try:
-            item_path = item.get("@id", "").replace(resolved_base.rstrip("/"), "").lstrip("/")
+            item_path = _rel_path(item.get("@id", ""), base_prefix)
             if not item_path:
-                errors += 1
-                CONSOLE.print(f"[yellow]Warning: Could not extract path from item '{item.get('title', 'unknown')}'[/yellow]")
-                continue
+                notes.append(f"[yellow]Warning: Could not extract path from item '{title}'[/yellow]")
+                return False, notes
             
             # Fetch current item to get actual subjects (more reliable than search result)
             try:
                 _, current_item = api.fetch(item_path, resolved_base, {}, {}, no_auth)
-                current_tags = (
-                    current_item.get("Subject") or
-                    current_item.get("subjects") or
-                    current_item.get("subject") or
-                    []
-                )
-                if isinstance(current_tags, str):
-                    current_tags = [current_tags] if current_tags else []
-                elif not isinstance(current_tags, list):
-                    current_tags = list(current_tags) if current_tags else []
-            except Exception as e:
+                current_tags = api.extract_subjects(current_item)
+            except api.APIError:
                 # Fallback to subjects from search result
-                current_tags = item.get("subjects", [])
+                current_tags = item.get("subjects")
+                if current_tags is None:
+                    notes.append(f"[red]Error updating '{title}': could not read its current tags[/red]")
+                    return False, notes
             
-            # Remove all source tags, add target tag if not present
-            new_tags = [tag for tag in current_tags if tag not in source_tags]
-            if target_tag not in new_tags:
-                new_tags.append(target_tag)
+            new_tags = _merged_tags(current_tags, drop, target_tag)
             
             # Only update if tags actually changed
-            if set(current_tags) != set(new_tags):
-                try:
-                    api.update_item_subjects(resolved_base, item_path, new_tags, no_auth=no_auth)
-                except api.APIError as update_error:
-                    errors += 1
-                    error_msg = str(update_error)
-                    if "__getitem__" in error_msg or "500" in error_msg:
-                        CONSOLE.print(f"[red]Server error updating '{item.get('title', 'unknown')}': {error_msg}[/red]")
-                        CONSOLE.print(f"[yellow]This is a known issue with the Plone REST API on this server. The Subject field may not be updatable via REST API.[/yellow]")
-                    else:
-                        CONSOLE.print(f"[red]Error updating '{item.get('title', 'unknown')}': {error_msg}[/red]")
-                    continue
-                
-                # Small delay to allow server to process the update before verification
-                time.sleep(0.1)  # 100ms delay
-                
-                # Verify the update succeeded by fetching the item again
-                try:
-                    _, verify_item = api.fetch(item_path, resolved_base, {}, {}, no_auth)
-                    verify_tags = (
-                        verify_item.get("Subject") or
-                        verify_item.get("subjects") or
-                        verify_item.get("subject") or
-                        []
-                    )
-                    if isinstance(verify_tags, str):
-                        verify_tags = [verify_tags] if verify_tags else []
-                    elif not isinstance(verify_tags, list):
-                        verify_tags = list(verify_tags) if verify_tags else []
-                    
-                    # Verify the update: source tags should be gone, target tag should be present
-                    source_tags_still_present = any(tag in verify_tags for tag in source_tags)
-                    target_tag_present = target_tag in verify_tags
-                    
-                    if source_tags_still_present:
-                        if target_tag_present:
-                            # Both present - update partially failed
-                            source_list = ", ".join(f"'{tag}'" for tag in source_tags if tag in verify_tags)
-                            CONSOLE.print(f"[yellow]Warning: Update failed for '{item.get('title', 'unknown')}'. Source tag(s) {source_list} still present, target tag '{target_tag}' also present. Update may have failed.[/yellow]")
-                            errors += 1
-                            continue
-                        else:
-                            # Source tags still there, target tag not added - update failed
-                            source_list = ", ".join(f"'{tag}'" for tag in source_tags if tag in verify_tags)
-                            CONSOLE.print(f"[yellow]Warning: Update failed for '{item.get('title', 'unknown')}'. Source tag(s) {source_list} still present, target tag '{target_tag}' not added.[/yellow]")
-                            errors += 1
-                            continue
-                    elif not target_tag_present:
-                        # Source tags removed but target tag not added - update failed
-                        CONSOLE.print(f"[yellow]Warning: Update failed for '{item.get('title', 'unknown')}'. Source tags removed but target tag '{target_tag}' not added.[/yellow]")
-                        errors += 1
-                        continue
-                    # Success: source tags removed, target tag present
-                except Exception:
-                    # Verification failed, but update was attempted
-                    # Assume it worked if we can't verify
-                    pass
-                
-                updated += 1
-            else:
+            if set(current_tags) == set(new_tags):
                 # Tags didn't change (maybe source tags weren't in the list)
                 if len(source_tags) == 1:
-                    CONSOLE.print(f"[yellow]Warning: Tag '{source_tags[0]}' not found in item '{item.get('title', 'unknown')}', skipping[/yellow]")
+                    notes.append(f"[yellow]Warning: Tag '{source_tags[0]}' not found in item '{title}', skipping[/yellow]")
+                return None, notes
+            
+            try:
+                api.update_item_subjects(resolved_base, item_path, new_tags, no_auth=no_auth)
+            except api.APIError as update_error:
+                error_msg = str(update_error)
+                if "__getitem__" in error_msg or "500" in error_msg:
+                    notes.append(f"[red]Server error updating '{title}': {error_msg}[/red]")
+                    notes.append("[yellow]This is a known issue with the Plone REST API on this server. The Subject field may not be updatable via REST API.[/yellow]")
+                else:
+                    notes.append(f"[red]Error updating '{title}': {error_msg}[/red]")
+                return False, notes
+            
+            # Verify the update succeeded by fetching the item again
+            try:
+                _, verify_item = api.fetch(item_path, resolved_base, {}, {}, no_auth)
+            except api.APIError:
+                # Verification failed, but update was attempted
+                # Assume it worked if we can't verify
+                return True, notes
+            verify_tags = api.extract_subjects(verify_item)
+            
+            # Verify the update: source tags should be gone, target tag should be present
+            still_present = [tag for tag in source_tags if tag in verify_tags]
+            target_tag_present = target_tag in verify_tags
+            if still_present:
+                source_list = ", ".join(f"'{tag}'" for tag in still_present)
+                if target_tag_present:
+                    # Both present - update partially failed
+                    notes.append(f"[yellow]Warning: Update failed for '{title}'. Source tag(s) {source_list} still present, target tag '{target_tag}' also present. Update may have failed.[/yellow]")
+                else:
+                    # Source tags still there, target tag not added - update failed
+                    notes.append(f"[yellow]Warning: Update failed for '{title}'. Source tag(s) {source_list} still present, target tag '{target_tag}' not added.[/yellow]")
+                return False, notes
+            if not target_tag_present:
+                # Source tags removed but target tag not added - update failed
+                notes.append(f"[yellow]Warning: Update failed for '{title}'. Source tags removed but target tag '{target_tag}' not added.[/yellow]")
+                return False, notes
+            # Success: source tags removed, target tag present
+            return True, notes
         except Exception as e:
-            errors += 1
-            CONSOLE.print(f"[red]Error updating {item.get('title', 'item')}: {e}[/red]")
+            notes.append(f"[red]Error updating {item.get('title', 'item')}: {e}[/red]")
+            return False, notes
+    
+    # Each item is fetched, patched and re-verified; overlap those round trips across items
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(items_list)))) as executor:
+        results = list(executor.map(merge_item, items_list))
+    # Report per item in search order, whichever worker finished first
+    for _, notes in results:
+        for note in notes:
+            CONSOLE.print(note)
+    outcomes = [outcome for outcome, _ in results]
+    updated = outcomes.count(True)
+    errors = outcomes.count(False)
     
     CONSOLE.print(f"[green]Updated {updated} item(s)[/green]")
     if errors:
@@ -1951,10 +2267,11 @@ def cmd_rename_tag(
     base: Optional[str] = typer.Option(None, "--base", help="Override the API base URL."),
     dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be changed without making changes."),
     no_auth: bool = typer.Option(False, "--no-auth", help="Skip saved auth headers."),
+    jobs: int = typer.Option(api.UPDATE_CONCURRENCY, "--jobs", "-j", min=1, help="Number of items to update at once."),
 ) -> None:
     """Rename a tag (same as merge-tags but removes old tag)."""
     # This is essentially the same as merge-tags with a single source
-    cmd_merge_tags([old_tag], new_tag, path, base, dry_run, no_auth)
+    cmd_merge_tags([old_tag], new_tag, path, base, dry_run, no_auth, jobs)
 
 
 @APP.command("remove-tag")
@@ -1964,6 +2281,7 @@ def cmd_remove_tag(
     base: Optional[str] = typer.Option(None, "--base", help="Override the API base URL."),
     dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be changed without making changes."),
     no_auth: bool = typer.Option(False, "--no-auth", help="Skip saved auth headers."),
+    jobs: int = typer.Option(api.UPDATE_CONCURRENCY, "--jobs", "-j", min=1, help="Number of items to update at once."),
 ) -> None:
     """Remove a tag from all items."""
     resolved_base = get_base_url(base)
@@ -1990,22 +2308,24 @@ def cmd_remove_tag(
         if not typer.confirm(f"Remove tag '{tag}' from {len(items)} item(s)?"):
             raise typer.Exit(0)
         
-        updated = 0
-        errors = 0
-        
+        skipped = api.fill_subjects(resolved_base, items, concurrency=jobs, no_auth=no_auth)
+        base_prefix = resolved_base.rstrip("/")
+        updates = _subject_updates(items, base_prefix, lambda tags: [t for t in tags if t != tag])
+        results, failures = api.update_items_subjects(resolved_base, updates, concurrency=jobs, no_auth=no_auth)
+        # Report per item in search order, whichever update finished first
         for item in items:
-            try:
-                item_path = item.get("@id", "").replace(resolved_base.rstrip("/"), "").lstrip("/")
-                current_tags = item.get("subjects", [])
-                new_tags = [t for t in current_tags if t != tag]
-                
-                api.update_item_subjects(resolved_base, item_path, new_tags, no_auth=no_auth)
-                updated += 1
-            except Exception as e:
-                errors += 1
-                CONSOLE.print(f"[red]Error updating {item.get('title', 'item')}: {e}[/red]")
+            item_id = item.get("@id", "")
+            fetch_error = skipped.get(item_id)
+            if fetch_error is not None:
+                CONSOLE.print(f"[red]Error reading tags of '{item.get('title', 'unknown')}': {fetch_error}[/red]")
+                continue
+            item_path = _rel_path(item_id, base_prefix)
+            error = failures.get(item_path)
+            if error is not None:
+                CONSOLE.print(f"[red]Error updating '{item.get('title') or item_path}': {error}[/red]")
         
-        CONSOLE.print(f"[green]Updated {updated} item(s)[/green]")
+        CONSOLE.print(f"[green]Updated {len(results)} item(s)[/green]")
+        errors = len(skipped) + len(failures)
         if errors:
             CONSOLE.print(f"[yellow]{errors} error(s) occurred[/yellow]")
     except api.APIError as e:
@@ -2040,9 +2360,12 @@ def cmd_similar_tags(
     base: Optional[str] = typer.Option(None, "--base", help="Override the API base URL."),
     threshold: int = typer.Option(70, "--threshold", "-t", help="Minimum similarity score (0-100). Default: 70."),
     no_auth: bool = typer.Option(False, "--no-auth", help="Skip saved auth headers."),
+    refresh: bool = typer.Option(False, "--refresh", help="Collect tags again instead of reusing a recent result."),
 ) -> None:
     """Find tags similar to the given tag using fuzzy matching. If no tag is provided, finds all pairs of similar tags."""
     resolved_base = get_base_url(base)
+    if refresh:
+        api.invalidate_tag_cache()
     try:
         similar_tags = api.find_similar_tags(resolved_base, query_tag, path, threshold, no_auth=no_auth)
         if not similar_tags: